@@ -27,6 +27,7 @@ class ToolConfig(BaseModel):
     image_format: str = "png"
     image_dpi: int = 200
     footnote_merge: bool = True
+    footnote_band_ratio: float = 0.85
     language_detection: bool = False
     char_gap_threshold: float = 2.0
     bold_width_ratio_threshold: float = 0.8
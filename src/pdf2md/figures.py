@@ -10,7 +10,8 @@ This module provides functionality to:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import hypot
 from typing import TYPE_CHECKING, Any
 
 from .models import BBox, Figure, Span
@@ -19,13 +20,62 @@ from .utils import deterministic_slug
 if TYPE_CHECKING:
     from .config import ToolConfig
 
-# Pattern for detecting figure captions (case insensitive)
+# Pattern for detecting figure captions (case insensitive), compiled once at
+# import so the hot scoring path never re-enters the re cache.
 CAPTION_PATTERN = re.compile(
     r"^\s*(?:fig(?:ure)?\.?\s*\d*|table\s*\d*|diagram\s*\d*)(?:\s*[:.]|\s|$)",
     re.IGNORECASE,
 )
 
 
+def _matches_caption_pattern(text: str) -> bool:
+    """Check if text starts with a caption prefix (Figure, Fig., Table, Diagram)."""
+    return CAPTION_PATTERN.match(text.strip()) is not None
+
+
+def _rect_gaps(bbox_a: BBox, bbox_b: BBox) -> tuple[float, float]:
+    """Calculate the per-axis gaps between two bounding boxes.
+
+    Uses the branchless center/half-extent form: the per-axis gap is
+    ``max(0, |center_a - center_b| - (extent_a + extent_b) / 2)``, which is
+    equivalent to the pairwise edge comparison but avoids nested max calls
+    and vectorizes cleanly if the bboxes are ever lifted into arrays.
+    """
+    ax1, ay1, ax2, ay2 = bbox_a
+    bx1, by1, bx2, by2 = bbox_b
+
+    horizontal_gap = max(0.0, abs((ax1 + ax2) - (bx1 + bx2)) / 2 - ((ax2 - ax1) + (bx2 - bx1)) / 2)
+    vertical_gap = max(0.0, abs((ay1 + ay2) - (by1 + by2)) / 2 - ((ay2 - ay1) + (by2 - by1)) / 2)
+    return horizontal_gap, vertical_gap
+
+
+def rect_distance(bbox_a: BBox, bbox_b: BBox) -> float:
+    """Calculate minimum Euclidean distance between two bounding boxes."""
+    return hypot(*_rect_gaps(bbox_a, bbox_b))
+
+
+def rect_distance_sq(bbox_a: BBox, bbox_b: BBox) -> float:
+    """Calculate squared minimum distance between two bounding boxes.
+
+    Prefer this for threshold filters and ordering, where the sqrt in
+    rect_distance adds nothing: comparisons are monotonic in the square.
+    """
+    horizontal_gap, vertical_gap = _rect_gaps(bbox_a, bbox_b)
+    return horizontal_gap * horizontal_gap + vertical_gap * vertical_gap
+
+
+@dataclass
+class UsedNames:
+    """Tracks generated figure filenames and the next collision suffix per base name.
+
+    Keeping the next free suffix per base name makes collision handling O(1)
+    per figure instead of re-probing the whole set for every colliding caption.
+    """
+
+    files: set[str] = field(default_factory=set)
+    next_suffix: dict[str, int] = field(default_factory=dict)
+
+
 @dataclass
 class CaptionCandidate:
     """A potential caption for a figure."""
@@ -60,7 +110,7 @@ def generate_figure_id(index: int, width: int = 3) -> str:
 
 
 def generate_figure_filename(
-    figure_id: str, caption: str | None, config: ToolConfig, used_filenames: set[str]
+    figure_id: str, caption: str | None, config: ToolConfig, used_names: UsedNames
 ) -> str:
     """Generate deterministic figure filename with collision handling.
 
@@ -68,17 +118,16 @@ def generate_figure_filename(
         figure_id: Figure ID (e.g., "fig_001")
         caption: Figure caption text (optional)
         config: Tool configuration
-        used_filenames: Set of already used filenames to check for collisions
+        used_names: Collision-tracking state shared across one document
 
     Returns:
         Unique filename with format "fig_001_caption-slug.png" or "fig_001.png"
 
     Examples:
         >>> config = ToolConfig()
-        >>> used = set()
+        >>> used = UsedNames()
         >>> generate_figure_filename("fig_001", "Sample Chart", config, used)
         'fig_001_sample-chart.png'
-        >>> used.add('fig_001_sample-chart.png')
         >>> generate_figure_filename("fig_002", "Sample Chart", config, used)
         'fig_002_sample-chart.png'
     """
@@ -94,19 +143,20 @@ def generate_figure_filename(
     # Add image format extension
     filename = f"{base_name}.{config.image_format}"
 
-    # Handle collisions by adding suffix
-    if filename in used_filenames:
-        base_without_ext = filename.rsplit(".", 1)[0]
-        extension = filename.rsplit(".", 1)[1]
-        counter = 2
+    # Handle collisions by adding suffix, resuming from the last suffix handed
+    # out for this base name instead of re-probing from 2 every time
+    if filename in used_names.files:
+        base_without_ext, extension = filename.rsplit(".", 1)
+        counter = used_names.next_suffix.get(base_without_ext, 2)
         while True:
             new_filename = f"{base_without_ext}-{counter}.{extension}"
-            if new_filename not in used_filenames:
+            counter += 1
+            if new_filename not in used_names.files:
                 filename = new_filename
                 break
-            counter += 1
+        used_names.next_suffix[base_without_ext] = counter
 
-    used_filenames.add(filename)
+    used_names.files.add(filename)
     return filename
 
 
@@ -124,23 +174,16 @@ def detect_caption_candidates(
         List of caption candidates within the configured distance
     """
     candidates = []
-    fig_x1, fig_y1, fig_x2, fig_y2 = figure.bbox
+    max_distance_sq = config.figure_caption_distance**2
 
     for span in spans:
         # Skip spans not on the same page
         if span.page != figure.page:
             continue
 
-        # Calculate distance from span to figure
-        span_x1, span_y1, span_x2, span_y2 = span.bbox
-
-        # Calculate minimum distance between span and figure bboxes
-        horizontal_distance = max(0, max(span_x1 - fig_x2, fig_x1 - span_x2))
-        vertical_distance = max(0, max(span_y1 - fig_y2, fig_y1 - span_y2))
-        distance = (horizontal_distance**2 + vertical_distance**2) ** 0.5
-
-        # Skip if too far away
-        if distance > config.figure_caption_distance:
+        # Skip if too far away; compare squared distances to avoid a sqrt
+        # per (figure, span) pair
+        if rect_distance_sq(span.bbox, figure.bbox) > max_distance_sq:
             continue
 
         # Create candidate
@@ -169,26 +212,21 @@ def score_caption_candidate(
         Score between 0.0 and 1.0 (higher is better)
     """
     # Distance component (closer is better)
-    fig_x1, fig_y1, fig_x2, fig_y2 = figure.bbox
-    cap_x1, cap_y1, cap_x2, cap_y2 = candidate.bbox
-
-    horizontal_distance = max(0, max(cap_x1 - fig_x2, fig_x1 - cap_x2))
-    vertical_distance = max(0, max(cap_y1 - fig_y2, fig_y1 - cap_y2))
-    distance = (horizontal_distance**2 + vertical_distance**2) ** 0.5
+    distance = rect_distance(candidate.bbox, figure.bbox)
 
     # Normalize distance score (1.0 at distance 0, 0.0 at max distance)
     distance_score = max(0.0, 1.0 - (distance / config.figure_caption_distance))
 
     # Position component (below figure is preferred)
-    cap_center_y = (cap_y1 + cap_y2) / 2
-    fig_center_y = (fig_y1 + fig_y2) / 2
+    cap_center_y = (candidate.bbox[1] + candidate.bbox[3]) / 2
+    fig_center_y = (figure.bbox[1] + figure.bbox[3]) / 2
 
     # Check if caption is below figure (higher Y values are lower on page in PDF coordinates)
     is_below = cap_center_y > fig_center_y
     position_score = 1.0 if is_below else 0.5  # Prefer below, but don't completely exclude above
 
     # Pattern component (matches "Fig.", "Figure", etc.)
-    pattern_score = 1.0 if CAPTION_PATTERN.match(candidate.text.strip()) else 0.3
+    pattern_score = 1.0 if _matches_caption_pattern(candidate.text) else 0.3
 
     # Weighted sum
     total_score = (
@@ -229,7 +267,7 @@ def bind_captions_to_figures(
                 c.score,  # Primary: highest score
                 _is_below_figure(c, figure),  # Secondary: below-figure preference
                 _has_pattern_match(c),  # Tertiary: pattern match preference
-                -_distance_to_figure(c, figure),  # Quaternary: closer distance (negative for desc)
+                -_distance_sq_to_figure(c, figure),  # Quaternary: closer wins (negative for desc)
             ),
             reverse=True,
         )
@@ -256,17 +294,12 @@ def _is_below_figure(candidate: CaptionCandidate, figure: Figure) -> bool:
 
 def _has_pattern_match(candidate: CaptionCandidate) -> bool:
     """Check if candidate matches caption pattern."""
-    return bool(CAPTION_PATTERN.match(candidate.text.strip()))
+    return _matches_caption_pattern(candidate.text)
 
 
-def _distance_to_figure(candidate: CaptionCandidate, figure: Figure) -> float:
-    """Calculate distance from candidate to figure."""
-    fig_x1, fig_y1, fig_x2, fig_y2 = figure.bbox
-    cap_x1, cap_y1, cap_x2, cap_y2 = candidate.bbox
-
-    horizontal_distance = max(0, max(cap_x1 - fig_x2, fig_x1 - cap_x2))
-    vertical_distance = max(0, max(cap_y1 - fig_y2, fig_y1 - cap_y2))
-    return float((horizontal_distance**2 + vertical_distance**2) ** 0.5)
+def _distance_sq_to_figure(candidate: CaptionCandidate, figure: Figure) -> float:
+    """Calculate squared distance from candidate to figure for tie-breaking."""
+    return rect_distance_sq(candidate.bbox, figure.bbox)
 
 
 def build_figure_projections(figures: list[Figure], filenames: list[str]) -> list[dict[str, Any]]:
@@ -291,22 +324,17 @@ def build_figure_projections(figures: list[Figure], filenames: list[str]) -> lis
         - page: Page number
         - bbox: Bounding box as list
     """
-    projections = []
-
-    for i, (figure, filename) in enumerate(zip(figures, filenames, strict=True)):
-        figure_id = generate_figure_id(i)
-
-        projection = {
-            "id": figure_id,
+    return [
+        {
+            "id": generate_figure_id(i),
             "filename": filename,
             "caption": figure.caption or "",
             "alt": figure.alt or "",
             "page": figure.page,
             "bbox": list(figure.bbox),  # Convert tuple to list for JSON
         }
-        projections.append(projection)
-
-    return projections
+        for i, (figure, filename) in enumerate(zip(figures, filenames, strict=True))
+    ]
 
 
 def process_figures_with_captions(
@@ -328,7 +356,7 @@ def process_figures_with_captions(
     # Generate figure IDs and filenames
     updated_figures = []
     filenames = []
-    used_filenames: set[str] = set()
+    used_names = UsedNames()
 
     for i, figure_with_candidate in enumerate(figures_with_candidates):
         figure = figure_with_candidate.figure
@@ -348,7 +376,7 @@ def process_figures_with_captions(
         )
 
         # Generate filename
-        filename = generate_figure_filename(figure_id, caption_text, config, used_filenames)
+        filename = generate_figure_filename(figure_id, caption_text, config, used_names)
 
         updated_figures.append(updated_figure)
         filenames.append(filename)
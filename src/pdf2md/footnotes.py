@@ -0,0 +1,169 @@
+"""Footnote detection and association functionality.
+
+This module provides functionality to:
+1. Detect footnote text spans in the bottom band of each page
+2. Merge multi-line footnote text into single entries
+3. Associate in-text reference markers with detected footnotes
+4. Build footnote projections for the manifest
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .models import BBox, Span
+
+if TYPE_CHECKING:
+    from .config import ToolConfig
+
+# Pattern for footnote text markers at the start of a bottom-band line,
+# e.g. "1 Footnote text", "2. Footnote text", "* Footnote text"
+FOOTNOTE_MARKER_PATTERN = re.compile(r"^\s*(\d{1,3}|[*†‡§])[.)]?\s+")
+
+# Pattern for in-text reference markers, either bracketed ("see [1]") or a
+# superscript-style digit glued to the preceding word ("as shown2")
+REFERENCE_PATTERN = re.compile(r"\[(\d{1,3})\]|(?<=[a-zA-Z,;:.!?)'\"])(\d{1,3})(?=\s|$)")
+
+
+@dataclass
+class Footnote:
+    """A footnote detected in the bottom band of a page."""
+
+    marker: str
+    text: str
+    page: int
+    bbox: BBox
+    spans: list[Span]
+
+
+@dataclass
+class FootnoteReference:
+    """An in-text reference marker bound to a detected footnote."""
+
+    span: Span
+    footnote: Footnote
+    marker: str
+
+
+def detect_footnote_text(
+    spans: list[Span], page_height: float, config: ToolConfig
+) -> list[Footnote]:
+    """Detect footnote text in the bottom band of each page.
+
+    Spans whose top edge lies below ``page_height * footnote_band_ratio`` are
+    treated as footnote material. A span starting with a marker ("1 ", "2. ",
+    "* ") opens a new footnote; subsequent band spans on the same page are
+    merged into the open footnote when ``footnote_merge`` is enabled.
+
+    Args:
+        spans: List of text spans from the document
+        page_height: Height of the page in points
+        config: Tool configuration
+
+    Returns:
+        List of detected footnotes in reading order
+    """
+    threshold = page_height * config.footnote_band_ratio
+
+    # Single pass over all spans: filter against the precomputed band
+    # threshold and sort the survivors into reading order (page,
+    # top-to-bottom, left-to-right) in one go
+    band_spans = sorted(
+        (span for span in spans if span.bbox[1] > threshold),
+        key=lambda s: (s.page, s.bbox[1], s.bbox[0]),
+    )
+
+    footnotes: list[Footnote] = []
+    current: Footnote | None = None
+
+    for span in band_spans:
+        marker_match = FOOTNOTE_MARKER_PATTERN.match(span.text)
+        if marker_match:
+            current = Footnote(
+                marker=marker_match.group(1),
+                text=span.text[marker_match.end() :].strip(),
+                page=span.page,
+                bbox=span.bbox,
+                spans=[span],
+            )
+            footnotes.append(current)
+        elif current is not None and config.footnote_merge and span.page == current.page:
+            # Continuation line of the open footnote
+            current.text = f"{current.text} {span.text.strip()}".strip()
+            current.bbox = _union_bbox(current.bbox, span.bbox)
+            current.spans.append(span)
+        # Band spans before the first marker (e.g. page numbers) are ignored
+
+    return footnotes
+
+
+def associate_footnotes(
+    spans: list[Span], footnotes: list[Footnote], config: ToolConfig
+) -> list[FootnoteReference]:
+    """Associate in-text reference markers with detected footnotes.
+
+    Args:
+        spans: List of text spans from the document (body and band alike)
+        footnotes: Footnotes previously detected by detect_footnote_text
+        config: Tool configuration
+
+    Returns:
+        List of references in span order; spans that are part of a footnote's
+        own text are never treated as references to it
+    """
+    # Index footnotes by (page, marker); markers restart per page in practice
+    by_page_marker: dict[tuple[int, str], Footnote] = {}
+    footnote_span_ids = set()
+    for footnote in footnotes:
+        by_page_marker[(footnote.page, footnote.marker)] = footnote
+        for span in footnote.spans:
+            footnote_span_ids.add(id(span))
+
+    references: list[FootnoteReference] = []
+    for span in spans:
+        if id(span) in footnote_span_ids:
+            continue
+        for match in REFERENCE_PATTERN.finditer(span.text):
+            marker = match.group(1) or match.group(2)
+            target = by_page_marker.get((span.page, marker))
+            if target is not None:
+                references.append(FootnoteReference(span=span, footnote=target, marker=marker))
+
+    return references
+
+
+def build_footnote_projections(footnotes: list[Footnote]) -> list[dict[str, Any]]:
+    """Build footnote projections for manifest from detected footnotes.
+
+    Footnote IDs are generated from the position in the list (fn_0000,
+    fn_0001, etc.), matching the id scheme the manifest exporter sorts by.
+
+    Args:
+        footnotes: List of Footnote objects in display order
+
+    Returns:
+        List of footnote projection dicts for manifest, each containing:
+        - id: Generated footnote ID (fn_0000, fn_0001, etc.)
+        - text: Footnote text
+        - page: Page number
+    """
+    return [
+        {
+            "id": f"fn_{i:04d}",
+            "text": footnote.text,
+            "page": footnote.page,
+        }
+        for i, footnote in enumerate(footnotes)
+    ]
+
+
+def _union_bbox(bbox_a: BBox, bbox_b: BBox) -> BBox:
+    """Calculate the union of two bounding boxes."""
+    return (
+        min(bbox_a[0], bbox_b[0]),
+        min(bbox_a[1], bbox_b[1]),
+        max(bbox_a[2], bbox_b[2]),
+        max(bbox_a[3], bbox_b[3]),
+    )
@@ -24,6 +24,10 @@ PART_PATTERN = re.compile(r"^part\s+\w+", re.IGNORECASE)
 APPENDIX_PATTERN = re.compile(r"^appendix\s+[a-zA-Z]", re.IGNORECASE)
 DOTTED_PATTERN = re.compile(r"^\d+(?:\.\d+)*\b")
 
+# All heading patterns, compiled once at import; detect_heading_level must
+# never fall back to re-compiling string literals per call
+_HEADING_PATTERNS = (CHAPTER_PATTERN, PART_PATTERN, APPENDIX_PATTERN, DOTTED_PATTERN)
+
 
 def detect_heading_level(text: str, config: ToolConfig) -> int | None:
     """Detect the heading level for a given text.
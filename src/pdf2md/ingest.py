@@ -2,14 +2,51 @@
 
 from __future__ import annotations
 
+import copyreg
+import re
+from collections.abc import Mapping
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, BinaryIO
 
 import pdfplumber
 
 from pdf2md.config import ToolConfig
 from pdf2md.models import BBox, Span
 
+# Style indicators compiled once at import; one C-level scan per font name
+# replaces a chain of substring lookups in the per-span hot path
+_BOLD_RE = re.compile(r"bold|black|heavy|thick", re.IGNORECASE)
+_ITALIC_RE = re.compile(r"italic|oblique|slant", re.IGNORECASE)
+_MONO_RE = re.compile(
+    r"courier|mono|fixed|consol|typewriter|lucida console|menlo|monaco"
+    r"|inconsolata|source code|fira code|anonymous pro",
+    re.IGNORECASE,
+)
+
+# Only eight flag combinations exist, so spans share pooled read-only
+# mappings instead of allocating a fresh three-entry dict apiece; mutation
+# attempts fail loudly instead of silently corrupting every sharing span.
+_FLAGS_POOL: dict[tuple[bool, bool, bool], Mapping[str, bool]] = {
+    (bold, italic, mono): MappingProxyType({"bold": bold, "italic": italic, "mono": mono})
+    for bold in (False, True)
+    for italic in (False, True)
+    for mono in (False, True)
+}
+
+
+# mappingproxy has no pickle support of its own; register a reducer so spans
+# carrying pooled flags survive pickling (fixture parse caches, process
+# pools). The restore helper exists because MappingProxyType itself cannot be
+# pickled by reference either.
+def _restore_flags_proxy(data: dict[str, bool]) -> MappingProxyType[str, bool]:
+    """Rebuild a read-only flags mapping when unpickling."""
+    return MappingProxyType(data)
+
+
+copyreg.pickle(MappingProxyType, lambda proxy: (_restore_flags_proxy, (dict(proxy),)))
+
 
 class PdfIngestor:
     """Extracts ordered Span objects from PDF with style flags and page info."""
@@ -22,27 +59,44 @@ class PdfIngestor:
         """
         self.config = config
 
-    def extract_spans(self, pdf_path: Path) -> list[Span]:
+    def extract_spans(self, pdf_source: Path | bytes | BinaryIO) -> list[Span]:
         """Extract spans from PDF with strictly increasing order_index.
 
         Args:
-            pdf_path: Path to the PDF file to process.
+            pdf_source: Path to the PDF file, raw PDF bytes, or an open binary
+                stream. Passing bytes or a stream skips the filesystem open,
+                which callers holding the document in memory should prefer.
 
         Returns:
             List of Span objects with order_index strictly increasing across all pages.
 
         Raises:
-            FileNotFoundError: If PDF file doesn't exist.
+            FileNotFoundError: If a path is given and the file doesn't exist.
             ValueError: If PDF cannot be read.
         """
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        source: Path | BytesIO
+        if isinstance(pdf_source, Path):
+            if not pdf_source.exists():
+                raise FileNotFoundError(f"PDF file not found: {pdf_source}")
+            source = pdf_source
+            source_desc = str(pdf_source)
+        elif isinstance(pdf_source, bytes):
+            source = BytesIO(pdf_source)
+            source_desc = f"<{len(pdf_source)} bytes in memory>"
+        elif isinstance(pdf_source, BytesIO):
+            source = pdf_source
+            source_desc = "<binary stream>"
+        else:
+            # Other binary streams are drained into a BytesIO, which is what
+            # pdfplumber's typed interface accepts
+            source = BytesIO(pdf_source.read())
+            source_desc = getattr(pdf_source, "name", None) or "<binary stream>"
 
         spans: list[Span] = []
         order_index = 0
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with pdfplumber.open(source) as pdf:
                 for page_num, page in enumerate(pdf.pages, start=1):
                     # Skip excluded pages
                     if page_num in self.config.exclude_pages:
@@ -57,7 +111,7 @@ class PdfIngestor:
                     order_index += len(page_spans)
 
         except Exception as e:
-            raise ValueError(f"Failed to read PDF {pdf_path}: {e}") from e
+            raise ValueError(f"Failed to read PDF {source_desc}: {e}") from e
 
         return spans
 
@@ -183,7 +237,9 @@ class PdfIngestor:
             order_index=order_index,
         )
 
-    def _detect_style_flags(self, font_name: str, chars: list[dict[str, Any]]) -> dict[str, bool]:
+    def _detect_style_flags(
+        self, font_name: str, chars: list[dict[str, Any]]
+    ) -> Mapping[str, bool]:
         """Detect style flags (bold, italic, mono) from font characteristics.
 
         Args:
@@ -191,50 +247,28 @@ class PdfIngestor:
             chars: List of character dictionaries for additional analysis.
 
         Returns:
-            Dictionary with style flags (bold, italic, mono).
+            Read-only mapping with style flags (bold, italic, mono), shared
+            across all spans with the same combination.
         """
-        style_flags = {"bold": False, "italic": False, "mono": False}
-
-        if not font_name:
-            return style_flags
-
-        font_name_lower = font_name.lower()
-
-        # Detect bold from font name
-        bold_indicators = ["bold", "black", "heavy", "thick"]
-        style_flags["bold"] = any(indicator in font_name_lower for indicator in bold_indicators)
-
-        # Detect italic from font name
-        italic_indicators = ["italic", "oblique", "slant"]
-        style_flags["italic"] = any(indicator in font_name_lower for indicator in italic_indicators)
-
-        # Detect monospace from font name
-        mono_indicators = [
-            "courier",
-            "mono",
-            "fixed",
-            "consol",
-            "typewriter",
-            "lucida console",
-            "menlo",
-            "monaco",
-            "inconsolata",
-            "source code",
-            "fira code",
-            "anonymous pro",
-        ]
-        style_flags["mono"] = any(indicator in font_name_lower for indicator in mono_indicators)
+        bold = italic = mono = False
+
+        if font_name:
+            # Detect bold/italic/mono from the font name with the precompiled
+            # indicator patterns
+            bold = _BOLD_RE.search(font_name) is not None
+            italic = _ITALIC_RE.search(font_name) is not None
+            mono = _MONO_RE.search(font_name) is not None
 
         # Additional heuristics based on character properties
-        if chars:
+        if font_name and chars:
             # Check for character-level style information if available
             first_char = chars[0]
 
             # Some PDFs store style in character attributes
             if "bold" in first_char:
-                style_flags["bold"] = bool(first_char["bold"])
+                bold = bool(first_char["bold"])
             if "italic" in first_char:
-                style_flags["italic"] = bool(first_char["italic"])
+                italic = bool(first_char["italic"])
 
             # Fallback: detect bold by font weight or width
             if "width" in first_char and first_char["width"] > 0:
@@ -243,6 +277,6 @@ class PdfIngestor:
                 # Heuristic: bold text typically has wider characters relative to font size
                 width_ratio = char_width / font_size if font_size > 0 else 0
                 if width_ratio > self.config.bold_width_ratio_threshold:
-                    style_flags["bold"] = True
+                    bold = True
 
-        return style_flags
+        return _FLAGS_POOL[(bold, italic, mono)]
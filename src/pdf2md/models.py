@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 BBox = tuple[float, float, float, float]
@@ -20,16 +22,23 @@ class BlockType:
     CALLOUT = "Callout"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Span:
     text: str
     bbox: BBox
     font_name: str
     font_size: float
-    style_flags: dict[str, bool]
+    # Mapping rather than dict: flags are read-only after construction, and
+    # callers may pass shared immutable mappings
+    style_flags: Mapping[str, bool]
     page: int
     order_index: int
 
+    def __post_init__(self) -> None:
+        # Documents reuse a handful of font names across thousands of spans;
+        # interning makes font comparisons pointer-equality and dedups storage
+        object.__setattr__(self, "font_name", sys.intern(self.font_name))
+
 
 @dataclass
 class Node:
@@ -38,7 +47,7 @@ class Node:
     meta: dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Figure:
     image_path: str
     caption: str | None
@@ -20,6 +20,10 @@ PART_PATTERN = re.compile(r"^part\s+(\w+)", re.IGNORECASE)
 APPENDIX_PATTERN = re.compile(r"^appendix\s+([a-zA-Z])", re.IGNORECASE)
 DOTTED_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)\b")
 
+# All numbering patterns, compiled once at import; process_heading_block must
+# never fall back to re-compiling string literals per call
+_NUMBERING_PATTERNS = (CHAPTER_PATTERN, PART_PATTERN, APPENDIX_PATTERN, DOTTED_PATTERN)
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +32,10 @@ class NumberingProcessor:
 
     def __init__(self, config: ToolConfig) -> None:
         self.config = config
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all numbering state so the processor can be reused for a new document."""
         self.global_chapter_counter = 0
         self.seen_chapter_numbers: set[int] = set()
         self.seen_appendix_letters: set[str] = set()
@@ -75,7 +83,10 @@ class NumberingProcessor:
             not self.config.numbering_allow_chapter_resets
             and explicit_number in self.seen_chapter_numbers
         ):
-            logger.warning("duplicate_chapter_number", extra={"explicit_number": explicit_number})
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "duplicate_chapter_number", extra={"explicit_number": explicit_number}
+                )
             # Treat as implicit sequence (no explicit number in meta)
         else:
             self.seen_chapter_numbers.add(explicit_number)
@@ -84,6 +95,7 @@ class NumberingProcessor:
         if (
             not self.config.numbering_allow_chapter_resets
             and explicit_number <= self.global_chapter_counter
+            and logger.isEnabledFor(logging.WARNING)
         ):
             logger.warning(
                 "chapter_number_reset_detected",
@@ -103,17 +115,22 @@ class NumberingProcessor:
         """Process appendix detection with page break rule and ordering."""
         # Check if appendix appears before first chapter
         if not self.first_chapter_detected:
-            logger.warning("appendix_early_ignored", extra={"letter": letter, "text": text})
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("appendix_early_ignored", extra={"letter": letter, "text": text})
             return
 
         # Check page break requirement
         if self.config.appendix_requires_page_break and not self._is_at_page_top(block):
-            logger.warning("appendix_missing_page_break", extra={"letter": letter, "text": text})
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "appendix_missing_page_break", extra={"letter": letter, "text": text}
+                )
             return
 
         # Check for duplicate letters
         if letter in self.seen_appendix_letters:
-            logger.warning("appendix_duplicate_letter", extra={"letter": letter, "text": text})
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("appendix_duplicate_letter", extra={"letter": letter, "text": text})
             # Demote to regular section (don't add appendix_letter to meta)
             return
 
@@ -121,7 +138,7 @@ class NumberingProcessor:
         if self.seen_appendix_letters:
             last_letter = max(self.seen_appendix_letters, key=lambda letter_char: ord(letter_char))
             expected_letter = chr(ord(last_letter) + 1)
-            if letter != expected_letter:
+            if letter != expected_letter and logger.isEnabledFor(logging.WARNING):
                 logger.warning(
                     "appendix_out_of_order",
                     extra={"letter": letter, "expected": expected_letter},
@@ -129,7 +146,8 @@ class NumberingProcessor:
 
         self.seen_appendix_letters.add(letter)
         meta["appendix_letter"] = letter
-        logger.info("appendix_detected", extra={"letter": letter})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("appendix_detected", extra={"letter": letter})
 
     def _process_dotted_path(self, dotted_text: str, meta: dict[str, object]) -> None:
         """Process dotted section paths with gap detection and depth limits."""
@@ -160,7 +178,7 @@ class NumberingProcessor:
         if prefix in self.seen_section_paths:
             last_seen = self.seen_section_paths[prefix]
             # Check for gap: if current number is more than 1 greater than last seen
-            if current_number > last_seen + 1:
+            if current_number > last_seen + 1 and logger.isEnabledFor(logging.WARNING):
                 logger.warning(
                     "section_gap_detected",
                     extra={
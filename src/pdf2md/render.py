@@ -7,11 +7,17 @@ the slug policy from the PRD.
 
 from __future__ import annotations
 
+import os
 import re
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from .config import ToolConfig
     from .models import SectionNode
 
@@ -19,6 +25,16 @@ if TYPE_CHECKING:
 PREFIXED_SLUG_PATTERN = re.compile(r"^\d+-")
 
 
+@lru_cache(maxsize=8)
+def _filename_formatter(width: int) -> Callable[[int, str], str]:
+    """Build the prefix-filename formatter for a zero-pad width once per width."""
+    if width == 2:
+        # Specialized fast path for the default config: %-formatting with a
+        # literal width beats the general format() protocol for small ints
+        return lambda index, slug: "%02d-%s.md" % (index, slug)  # noqa: UP031
+    return f"{{:0{width}d}}-{{}}.md".format
+
+
 def generate_filename(section: SectionNode, prefix_index: int, config: ToolConfig) -> str:
     """Generate filename for a section following the slug policy.
 
@@ -51,9 +67,8 @@ def generate_filename(section: SectionNode, prefix_index: int, config: ToolConfi
     if PREFIXED_SLUG_PATTERN.match(slug):
         return f"{slug}.md"
 
-    # Otherwise, add the prefix using the configured width
-    width = config.slug_prefix_width
-    return f"{prefix_index:0{width}d}-{slug}.md"
+    # Otherwise, add the prefix via the formatter cached for this width
+    return _filename_formatter(config.slug_prefix_width)(prefix_index, slug)
 
 
 def render_section_stub(section: SectionNode) -> str:
@@ -70,7 +85,9 @@ def render_section_stub(section: SectionNode) -> str:
         >>> render_section_stub(section)
         '# Introduction\\n'
     """
-    return f"# {section.title}\n"
+    # Three-part join takes CPython's small-tuple fast path and skips the
+    # FORMAT_VALUE machinery an f-string would run per section
+    return "".join(("# ", section.title, "\n"))
 
 
 def render_sections(
@@ -79,6 +96,7 @@ def render_sections(
     config: ToolConfig,
     *,
     book_subdir: str = "book",
+    writer: Callable[[Path, str], None] | None = None,
 ) -> list[Path]:
     """Render sections to minimal Markdown stub files.
 
@@ -87,6 +105,9 @@ def render_sections(
         output_dir: Base output directory
         config: Tool configuration
         book_subdir: Subdirectory name for markdown files (default: "book")
+        writer: Optional override receiving (path, content) for each section.
+            When given, no directory is created and nothing touches the
+            filesystem — callers own persistence (e.g. an in-memory sink).
 
     Returns:
         List of paths to written markdown files
@@ -95,43 +116,96 @@ def render_sections(
         OSError: If directory creation or file writing fails
     """
     book_dir = output_dir / book_subdir
-    book_dir.mkdir(parents=True, exist_ok=True)
+
+    # Default path: write into a hidden staging directory inside book_dir and
+    # rename onto the final names at the end. Staging on the same filesystem
+    # keeps every publish an atomic os.replace, so readers of book_dir never
+    # observe partially written section files.
+    staging_dir: Path | None = None
+    if writer is None:
+        book_dir.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=book_dir))
+        write = _staging_writer(staging_dir)
+    else:
+        write = writer
 
     written_files = []
 
-    # Flatten all sections in pre-order (parent before children)
-    all_sections = _flatten_sections_preorder(sections)
+    # One string concatenation per file instead of Path.__truediv__'s re-parse
+    book_dir_prefix = f"{book_dir}{os.sep}"
 
-    for i, section in enumerate(all_sections):
-        prefix_index = i + 1  # 1-based indexing for filename prefixes
-        filename = generate_filename(section, prefix_index, config)
-        file_path = book_dir / filename
+    try:
+        # Emit sections in pre-order (parent before children), numbering as we go
+        for prefix_index, section in _iter_sections_preorder(sections):
+            filename = generate_filename(section, prefix_index, config)
+            file_path = Path(book_dir_prefix + filename)
 
-        content = render_section_stub(section)
+            content = render_section_stub(section)
 
-        file_path.write_text(content, encoding="utf-8")
-        written_files.append(file_path)
+            write(file_path, content)
+            written_files.append(file_path)
+    except BaseException:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    if staging_dir is not None:
+        _move_staged_files(staging_dir, written_files)
 
     return written_files
 
 
-def _flatten_sections_preorder(sections: list[SectionNode]) -> list[SectionNode]:
-    """Flatten section tree in pre-order traversal (parent before children).
+def _staging_writer(staging_dir: Path) -> Callable[[Path, str], None]:
+    """Build a writer that lands section files in the staging directory."""
 
-    Args:
-        sections: List of root SectionNode objects
+    def write(path: Path, content: str) -> None:
+        _write_text_file(staging_dir / path.name, content)
 
-    Returns:
-        Flattened list of all SectionNode objects in pre-order
+    return write
+
+
+def _move_staged_files(staging_dir: Path, targets: list[Path]) -> None:
+    """Move staged section files onto their final paths and drop the staging dir.
+
+    Duplicate targets (sections whose slugs collapse to the same filename)
+    share one staged file holding the last write, so each name is published
+    exactly once — matching the last-write-wins behavior of direct writes.
+    """
+    try:
+        published = set()
+        for target in targets:
+            if target.name in published:
+                continue
+            os.replace(staging_dir / target.name, target)
+            published.add(target.name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _write_text_file(path: Path, content: str) -> None:
+    """Write markdown content to disk (default render_sections writer).
+
+    Encodes up front and writes the bytes in one go, skipping the buffered
+    TextIOWrapper layer that write_text would stack on the binary file.
     """
-    result = []
+    path.write_bytes(content.encode("utf-8"))
 
-    def _visit(section: SectionNode) -> None:
-        result.append(section)
-        for child in section.children:
-            _visit(child)
 
-    for section in sections:
-        _visit(section)
+def _iter_sections_preorder(sections: list[SectionNode]) -> Iterator[tuple[int, SectionNode]]:
+    """Yield (1-based index, section) pairs in pre-order (parent before children).
 
-    return result
+    Args:
+        sections: List of root SectionNode objects
+
+    Yields:
+        Tuples of the running prefix index and each SectionNode in pre-order
+    """
+    # Explicit-stack walk: no per-node Python frame, no intermediate flat
+    # list, and depth is bounded by the stack rather than the recursion limit
+    stack = list(reversed(sections))
+    index = 0
+    while stack:
+        section = stack.pop()
+        index += 1
+        yield index, section
+        stack.extend(reversed(section.children))
@@ -8,11 +8,16 @@ structured blocks (paragraphs, lists, code blocks, etc.).
 from __future__ import annotations
 
 import re
+from itertools import pairwise
+from operator import attrgetter
+from os.path import commonprefix
 from typing import TYPE_CHECKING, cast
 
-from .utils import repair_hyphenation
+from .utils import iter_repair_hyphenation
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from .config import ToolConfig
     from .models import Block, Span
 
@@ -20,6 +25,17 @@ if TYPE_CHECKING:
 # Pattern to match punctuation-only spans that should not have spaces before them
 PUNCTUATION_ONLY_RE = re.compile(r'^[^\w\s]+$')
 
+# Single-character punctuation spans dominate the punctuation rule in real
+# documents; a frozenset lookup resolves them without entering the regex.
+# The en dash is intentional alongside the em dash: both occur in PDF text.
+_COMMON_PUNCTUATION = frozenset(".,:;!?-—–'\"()[]{}/")  # noqa: RUF001
+
+
+def _is_punctuation_only(text: str) -> bool:
+    """Check if a span's text is punctuation that should attach without a space."""
+    return text in _COMMON_PUNCTUATION or PUNCTUATION_ONLY_RE.match(text) is not None
+
+
 # Patterns for list item detection
 BULLET_LIST_RE = re.compile(r"^\s*[•·▪▫‣-]\s+")
 ORDERED_LIST_RE = re.compile(r'^\s*(\d+|[a-zA-Z]+)\.\s+')
@@ -31,6 +47,9 @@ TABLE_PATTERN = re.compile(r'^\s*\S+(?:\s{2,}\S+)+\s*$')
 SPACE_WIDTH_ESTIMATE = 5  # Estimated width of a space character in points
 POINTS_PER_NESTING_LEVEL = 25.0  # Points per indentation level for list nesting
 
+# C-level sort key for reading order, shared by the span sorts below
+_ORDER_INDEX_KEY = attrgetter("order_index")
+
 
 def assemble_blocks(spans: list[Span], config: ToolConfig) -> list[Block]:
     """Assemble spans into logical blocks (paragraphs, lists, code blocks, etc.).
@@ -70,7 +89,9 @@ def assemble_blocks(spans: list[Span], config: ToolConfig) -> list[Block]:
     if not line_groups:
         return []
 
-    # Group line groups into blocks
+    # Group line groups into blocks; pydantic attribute reads are dict
+    # lookups, so hoist the per-iteration config value to a local
+    code_min_lines = config.code_min_lines
     blocks = []
     current_block_line_groups: list[list[Span]] = []
     current_block_type: str | None = None
@@ -109,7 +130,7 @@ def assemble_blocks(spans: list[Span], config: ToolConfig) -> list[Block]:
             code_line_groups, consumed = _extract_code_block_from_line_groups(
                 line_groups, i, config
             )
-            if len(code_line_groups) >= config.code_min_lines:
+            if len(code_line_groups) >= code_min_lines:
                 # Finish current block if any
                 if current_block_line_groups and current_block_type is not None:
                     block = _create_block_from_line_groups(
@@ -197,6 +218,49 @@ def assemble_blocks(spans: list[Span], config: ToolConfig) -> list[Block]:
     return blocks
 
 
+def assemble_blocks_pages(
+    spans: list[Span], config: ToolConfig, *, max_workers: int | None = None
+) -> list[Block]:
+    """Assemble blocks page by page, fanning pages out to worker processes.
+
+    Each page is classified in isolation, so this entry point never produces
+    page-spanning blocks: where assemble_blocks merges a paragraph (or any
+    line group) that straddles a page break into one block with a multi-page
+    page_span, this function splits it into one block per page. Use it only
+    when that divergence is acceptable in exchange for parallelism on large
+    documents. Small documents (two pages or fewer) are processed inline
+    since process startup would dominate the work.
+
+    Args:
+        spans: List of Span objects to process, assumed to be sorted by order_index.
+        config: ToolConfig instance containing block assembly parameters.
+        max_workers: Optional worker-process cap (defaults to the executor's).
+
+    Returns:
+        List of Block objects in page order.
+    """
+    spans_by_page: dict[int, list[Span]] = {}
+    for span in spans:
+        spans_by_page.setdefault(span.page, []).append(span)
+    pages = sorted(spans_by_page)
+
+    if len(pages) <= 2:
+        blocks: list[Block] = []
+        for page in pages:
+            blocks.extend(assemble_blocks(spans_by_page[page], config))
+        return blocks
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        per_page_blocks = pool.map(
+            partial(assemble_blocks, config=config),
+            (spans_by_page[page] for page in pages),
+        )
+        return [block for page_blocks in per_page_blocks for block in page_blocks]
+
+
 def _group_spans_into_lines_with_spans(spans: list[Span], config: ToolConfig) -> list[list[Span]]:
     """Group spans into logical lines while preserving the span information.
 
@@ -492,26 +556,14 @@ def _dedent_code_lines(lines: list[str]) -> list[str]:
     if not lines:
         return []
 
-    # Find minimum indentation of non-empty lines
-    min_indent = None
-    for line in lines:
-        stripped = line.strip()
-        if stripped:  # Only consider non-empty lines
-            leading_spaces = len(line) - len(line.lstrip())
-            min_indent = leading_spaces if min_indent is None else min(min_indent, leading_spaces)
-
-    if min_indent is None:
-        min_indent = 0
-
-    # Remove the common indentation
-    dedented = []
-    for line in lines:
-        if line.strip():  # Non-empty line
-            dedented.append(line[min_indent:])
-        else:
-            dedented.append("")  # Preserve empty lines
+    # Common leading-whitespace prefix of non-empty lines; commonprefix runs
+    # its character comparisons in C and, unlike a raw indent count, never
+    # strips through mixed tab/space indentation
+    prefixes = [line[: len(line) - len(line.lstrip())] for line in lines if line.strip()]
+    prefix_len = len(commonprefix(prefixes))
 
-    return dedented
+    # Remove the common indentation, preserving empty lines as empty
+    return [line[prefix_len:] if line.strip() else "" for line in lines]
 
 
 def _create_nested_list_block(line_groups: list[list[Span]], config: ToolConfig) -> Block | None:
@@ -1009,29 +1061,48 @@ def merge_lines(spans: list[Span], config: ToolConfig) -> list[str]:
         >>> merge_lines(spans, config)
         ['Hello world', 'This is a test']
     """
-    if not spans:
-        return []
+    return list(iter_merged_lines(spans, config))
 
-    # Sort spans by order_index to ensure proper ordering
-    sorted_spans = sorted(spans, key=lambda s: s.order_index)
 
-    # Group spans into logical lines, preserving order
-    lines = _group_spans_into_lines_ordered(sorted_spans, config.line_merge_y_tolerance)
+def iter_merged_lines(spans: list[Span], config: ToolConfig) -> Iterator[str]:
+    """Stream merged text lines without materializing the whole document.
 
-    # Convert each line group to text
-    text_lines = []
-    for line_spans in lines:
-        # Sort spans within the line by x-coordinate (left to right)
-        line_spans.sort(key=lambda s: s.bbox[0])  # Sort by x0 (left edge)
+    Same semantics as merge_lines, but each line is yielded as soon as its
+    span group closes and hyphenation repair settles, so callers processing
+    long documents never hold every line in memory at once.
 
-        # Join text from spans in the line with appropriate spacing
-        line_text = _join_spans_with_smart_spacing(line_spans)
+    Args:
+        spans: List of Span objects to merge. Sorted by order_index if needed.
+        config: ToolConfig instance containing line merging parameters.
 
-        if line_text:
-            text_lines.append(line_text)
+    Yields:
+        Merged text lines with hyphenation repaired, in reading order.
+    """
+    if not spans:
+        return
+
+    # Sort spans by order_index to ensure proper ordering; ingestion emits
+    # them already ordered, so probe first and skip the sort when possible
+    if any(right.order_index < left.order_index for left, right in pairwise(spans)):
+        sorted_spans = sorted(spans, key=_ORDER_INDEX_KEY)
+    else:
+        sorted_spans = spans
+
+    def line_texts() -> Iterator[str]:
+        for line_spans in _iter_lines_ordered(sorted_spans, config.line_merge_y_tolerance):
+            # Sort spans within the line by x0 (left to right); extractors
+            # usually emit in reading order, so probe before paying the sort
+            if any(right.bbox[0] < left.bbox[0] for left, right in pairwise(line_spans)):
+                line_spans.sort(key=lambda s: s.bbox[0])
+
+            # Join text from spans in the line with appropriate spacing
+            line_text = _join_spans_with_smart_spacing(line_spans)
+
+            if line_text:
+                yield line_text
 
-    # Apply hyphenation repair to the merged lines
-    return repair_hyphenation(text_lines)
+    # Apply hyphenation repair as the lines stream through
+    yield from iter_repair_hyphenation(line_texts())
 
 
 def _group_spans_into_lines_ordered(spans: list[Span], y_tolerance: float) -> list[list[Span]]:
@@ -1048,31 +1119,33 @@ def _group_spans_into_lines_ordered(spans: list[Span], y_tolerance: float) -> li
     Returns:
         List of span groups, each representing a logical line, in order.
     """
+    return list(_iter_lines_ordered(spans, y_tolerance))
+
+
+def _iter_lines_ordered(spans: list[Span], y_tolerance: float) -> Iterator[list[Span]]:
+    """Yield logical-line span groups in order, one group at a time."""
     if not spans:
-        return []
+        return
 
-    lines: list[list[Span]] = []
     current_line: list[Span] = [spans[0]]
+    prev_y = _get_span_y_center(spans[0])
 
+    # Single sweep: each span's y-center is computed exactly once and carried
+    # forward, instead of re-deriving the previous span's center per step
     for span in spans[1:]:
-        # Get y-coordinate (middle of bounding box) for comparison
         current_y = _get_span_y_center(span)
-        prev_y = _get_span_y_center(current_line[-1])
 
         # If y-coordinates are close enough, add to current line
         if abs(current_y - prev_y) <= y_tolerance:
             current_line.append(span)
         else:
             # Start a new line
-            if current_line:
-                lines.append(current_line)
+            yield current_line
             current_line = [span]
+        prev_y = current_y
 
     # Don't forget the last line
-    if current_line:
-        lines.append(current_line)
-
-    return lines
+    yield current_line
 
 
 def _join_spans_with_smart_spacing(spans: list[Span]) -> str:
@@ -1087,27 +1160,21 @@ def _join_spans_with_smart_spacing(spans: list[Span]) -> str:
     Returns:
         Joined text with appropriate spacing.
     """
-    if not spans:
-        return ""
-
-    result_parts = []
-    for i, span in enumerate(spans):
+    # Single fused pass: strip, drop empties, apply the punctuation rule and
+    # collect the joined parts without intermediate lists. "First" is keyed
+    # off the output so a leading empty span can't smuggle in a space.
+    result_parts: list[str] = []
+    for span in spans:
         text = span.text.strip()
         if not text:
             continue
 
-        if i == 0:
-            # First span always added without prefix
+        if not result_parts or _is_punctuation_only(text):
+            # First emitted span, or punctuation joined directly without space
             result_parts.append(text)
         else:
-            # Check if this span is punctuation-only
-            is_punctuation = PUNCTUATION_ONLY_RE.match(text)
-            if is_punctuation:
-                # Join punctuation directly without space
-                result_parts.append(text)
-            else:
-                # Normal span gets a space prefix
-                result_parts.append(" " + text)
+            # Normal span gets a space prefix
+            result_parts.append(" " + text)
 
     return "".join(result_parts)
 
@@ -1142,8 +1209,7 @@ def _join_spans_preserving_leading_whitespace(spans: list[Span]) -> str:
                 continue
 
             # Check if this span is punctuation-only
-            is_punctuation = PUNCTUATION_ONLY_RE.match(text)
-            if is_punctuation:
+            if _is_punctuation_only(text):
                 # Join punctuation directly without space
                 result_parts.append(text)
             else:
@@ -1,27 +1,72 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextvars import ContextVar
+from functools import lru_cache
 
 from slugify import slugify as _slugify
 
 SLUG_SAFE_REMOVE = ["'", '"']
 
-# Module-level cache to track base slug counts per used_slugs set
-# This avoids the need to reverse-engineer base slugs from final slugs
-_base_slug_cache: dict[int, dict[str, int]] = {}
+# Translate table form of SLUG_SAFE_REMOVE: one C-level pass over the text
+# instead of one .replace scan per character
+_SLUG_SAFE_REMOVE_TABLE = str.maketrans("", "", "".join(SLUG_SAFE_REMOVE))
 
+# Constant format strings for the widths that occur in practice; building a
+# dynamic format spec per call is measurably slower
+_PREFIX_FORMATS = {1: "{}-{}".format, 2: "{:02d}-{}".format, 3: "{:03d}-{}".format}
 
+# Context-local cache to track base slug counts per used_slugs set. This
+# avoids the need to reverse-engineer base slugs from final slugs, and keeping
+# it per-context means concurrent conversions never contend on shared state.
+_base_slug_cache: ContextVar[dict[int, dict[str, int]] | None] = ContextVar(
+    "base_slug_cache", default=None
+)
+
+
+def _get_base_slug_cache() -> dict[int, dict[str, int]]:
+    """Return this context's base-slug cache, creating it lazily."""
+    cache = _base_slug_cache.get()
+    if cache is None:
+        cache = {}
+        _base_slug_cache.set(cache)
+    return cache
+
+
+@lru_cache(maxsize=4096)
 def deterministic_slug(text: str, prefix_index: int | None = None, width: int = 2) -> str:
-    base = text.strip().lower()
-    for ch in SLUG_SAFE_REMOVE:
-        base = base.replace(ch, "")
+    base = text.strip().lower().translate(_SLUG_SAFE_REMOVE_TABLE)
     s = _slugify(base)
     if prefix_index is not None:
+        fmt = _PREFIX_FORMATS.get(width)
+        if fmt is not None:
+            return fmt(prefix_index, s)
         return f"{prefix_index:0{width}d}-{s}"
     return s
 
 
+def deterministic_slugs(titles: Iterable[str], start_index: int = 1, width: int = 2) -> list[str]:
+    """Generate prefixed slugs for a batch of titles with consecutive indices.
+
+    Args:
+        titles: Section titles in display order
+        start_index: Prefix index assigned to the first title
+        width: Width for zero-padding the prefixes
+
+    Returns:
+        List of prefixed slugs, one per title
+
+    Examples:
+        >>> deterministic_slugs(["Intro", "Data Analysis"])
+        ['01-intro', '02-data-analysis']
+    """
+    return [
+        deterministic_slug(title, prefix_index, width)
+        for prefix_index, title in enumerate(titles, start_index)
+    ]
+
+
 def generate_unique_slug(
     text: str, prefix_index: int | None, width: int, used_slugs: set[str]
 ) -> str:
@@ -51,11 +96,12 @@ def generate_unique_slug(
 
     # Get or create base slug counter for this used_slugs set
     # This avoids the need to reverse-engineer base slugs from final slugs
+    cache = _get_base_slug_cache()
     cache_key = id(used_slugs)
-    if cache_key not in _base_slug_cache:
-        _base_slug_cache[cache_key] = {}
+    if cache_key not in cache:
+        cache[cache_key] = {}
 
-    base_counts = _base_slug_cache[cache_key]
+    base_counts = cache[cache_key]
     collision_count = base_counts.get(base_text_slug, 0)
 
     if collision_count == 0:
@@ -81,32 +127,39 @@ def clear_slug_cache() -> None:
     This should be called when you're done with a set of used_slugs
     to prevent the cache from growing indefinitely.
     """
-    global _base_slug_cache
-    _base_slug_cache.clear()
+    _base_slug_cache.set({})
+    deterministic_slug.cache_clear()
 
 
 HYPHENATION_RE = re.compile(r"([A-Za-z]{3,})-$")
 
 
-def repair_hyphenation(lines: Iterable[str]) -> list[str]:
-    result: list[str] = []
+def iter_repair_hyphenation(lines: Iterable[str]) -> Iterator[str]:
+    """Stream hyphenation repair, yielding each finished line as it settles."""
     pending = None
     for line in lines:
         line = line.rstrip()
         if pending is not None:
-            if line and line[0].islower():
-                result.append(pending + line)
+            # slice-then-islower folds the emptiness branch into one C call
+            # ("".islower() is False) and stays correct for non-ASCII text
+            if line[:1].islower():
+                yield pending + line
             else:
-                result.append(pending + "-" + line)
+                yield pending + "-" + line
             pending = None
             continue
-        if HYPHENATION_RE.search(line):
+        # Cheap literal suffix check first; most lines don't end in a hyphen,
+        # so the regex engine is only entered for real candidates
+        if line.endswith("-") and HYPHENATION_RE.search(line):
             pending = line[:-1]
         else:
-            result.append(line)
+            yield line
     if pending is not None:
-        result.append(pending)
-    return result
+        yield pending
+
+
+def repair_hyphenation(lines: Iterable[str]) -> list[str]:
+    return list(iter_repair_hyphenation(lines))
 
 
 HEADING_PATTERN = re.compile(
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import importlib
+import logging
 import os
+import pickle
 import sys
+import tempfile
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+from pdf2md.config import ToolConfig
+from pdf2md.models import Span
 from pdf2md.utils import clear_slug_cache
 
 
@@ -22,6 +32,150 @@ _ensure_paths()
 # Ensure deterministic environment for tests
 os.environ.setdefault("PYTHONHASHSEED", "0")
 
+# Keep pytest tmp dirs on a RAM-backed tmpfs when one is available, so the
+# file-writing tests never touch the disk backing /tmp. PYTEST_DEBUG_TEMPROOT
+# is the only knob pytest exposes for relocating its basetemp from conftest;
+# pytest still creates per-session, per-worker subdirectories beneath it, so
+# the shared-tmpdir concern behind S108 doesn't apply.
+if os.access("/dev/shm", os.W_OK):  # noqa: S108
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")  # noqa: S108
+
+
+@cache
+def cfg(**kwargs):
+    """Return a memoized ToolConfig for the given keyword overrides.
+
+    Repeated requests for the same override set (e.g. footnote_merge=False)
+    share one validated instance across the suite. Callers must treat the
+    returned config as read-only.
+    """
+    return ToolConfig(**kwargs)
+
+
+@cache
+def _ingest_source_digest() -> str:
+    """Digest of the extractor's source, folded into the parse-cache key.
+
+    Without it a warm cache would keep serving spans pickled by an older
+    pdf2md.ingest, and the ingestion tests would stop exercising the
+    extractor after any change to it.
+    """
+    from pdf2md import ingest
+
+    return hashlib.blake2b(Path(ingest.__file__).read_bytes()).hexdigest()[:16]
+
+
+def extract_spans_cached(pdf_path: Path) -> list[Span]:
+    """Extract spans from a fixture PDF, caching the parse on disk.
+
+    The fixture PDFs are static build artifacts, so the parsed span lists are
+    pickled under the system temp dir keyed by path, mtime, size and the
+    ingest source digest; warm CI caches (actions/cache over the temp dir)
+    then skip PDF decoding entirely.
+    """
+    from pdf2md.ingest import PdfIngestor
+
+    stat = pdf_path.stat()
+    key_source = f"{pdf_path}:{stat.st_mtime_ns}:{stat.st_size}:{_ingest_source_digest()}".encode()
+    key = hashlib.blake2b(key_source).hexdigest()[:16]
+    cache_file = Path(tempfile.gettempdir()) / "pdf2md-fix-cache" / f"{key}.pkl"
+
+    if cache_file.exists():
+        with cache_file.open("rb") as f:
+            spans_from_cache: list[Span] = pickle.load(f)  # noqa: S301 - local fixture cache
+            return spans_from_cache
+
+    spans = PdfIngestor(ToolConfig()).extract_spans(pdf_path.read_bytes())
+
+    # Write atomically so concurrent xdist workers never read a partial pickle
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_bytes(pickle.dumps(spans))
+    os.replace(tmp_file, cache_file)
+    return spans
+
+
+# Constant style-flag mappings shared by span-constructing tests; Span is
+# frozen and the pipeline only reads flags, so one immutable instance of each
+# serves every literal and mutation attempts fail loudly
+PLAIN_FLAGS: Mapping[str, bool] = MappingProxyType({})
+MONO_FLAGS: Mapping[str, bool] = MappingProxyType({"mono": True})
+BOLD_FLAGS: Mapping[str, bool] = MappingProxyType({"bold": True})
+
+
+def make_span(text, bbox, order=0, font="Arial", size=12, page=1, flags=PLAIN_FLAGS):
+    """Build a Span with the constant font/style fields filled in."""
+    return Span(text, bbox, font, size, flags, page, order)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Provide one read-only default ToolConfig for the whole session.
+
+    Modules needing different semantics override this with their own fixture;
+    tests needing overrides use config_with or construct their own instance.
+    """
+    return cfg()
+
+
+@pytest.fixture
+def config_with(request):
+    """Build a ToolConfig with overrides passed via indirect parametrize.
+
+    Usage::
+
+        @pytest.mark.parametrize("config_with", [{"code_min_lines": 3}], indirect=True)
+        def test_something(config_with): ...
+    """
+    return cfg(**request.param)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preimport():
+    """Pre-import the pdf2md submodules used across the test tree.
+
+    Pays the import (and regex pre-compilation) cost of the pipeline modules
+    once per session instead of on first use inside whichever test file
+    happens to run first.
+    """
+    import pdf2md.build_tree
+    import pdf2md.figures
+    import pdf2md.footnotes
+    import pdf2md.headings
+    import pdf2md.models
+    import pdf2md.structure  # noqa: F401 - imported for the side effect only
+
+
+@pytest.fixture(scope="session")
+def basic_pdf_bytes(tmp_path_factory):
+    """Generate the basic_headings fixture PDF once per session.
+
+    Font embedding dominates fixture generation cost, so tests that only need
+    a generated PDF share this (path, bytes) pair instead of re-invoking the
+    generator. The generator module is imported lazily so the rest of the
+    suite still runs when reportlab is unavailable.
+    """
+    gen = importlib.import_module("scripts.gen_fixtures")
+    path = tmp_path_factory.mktemp("pdf") / "basic_headings.pdf"
+    gen.make_basic_headings(path)
+    return path, path.read_bytes()
+
+
+@pytest.fixture(autouse=True)
+def _silence_numbering_logs():
+    """Silence the numbering logger unless a test opts back in.
+
+    Most tests only inspect returned metadata; raising the logger level to
+    CRITICAL skips record creation and formatting on the warning paths. Tests
+    asserting on logs re-enable them with
+    caplog.at_level(..., logger="pdf2md.numbering").
+    """
+    logger = logging.getLogger("pdf2md.numbering")
+    previous = logger.level
+    logger.setLevel(logging.CRITICAL)
+    yield
+    logger.setLevel(previous)
+
 
 @pytest.fixture(autouse=True)
 def clear_cache():
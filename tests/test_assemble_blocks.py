@@ -0,0 +1,583 @@
+"""Tests for block assembly (paragraphs, lists, code blocks, tables)."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import BOLD_FLAGS as _BOLD
+from conftest import MONO_FLAGS as _MONO
+from conftest import make_span as _sp
+
+from pdf2md.models import BlockType, Span
+from pdf2md.structure import assemble_blocks, assemble_blocks_pages
+
+# Immutable span sequences shared by the classification tests below; the
+# pipeline never mutates its input, so the same tuples serve every run
+BULLET_LIST_SPANS = (
+    _sp("• First item", (0, 100, 80, 110)),
+    _sp("• Second item", (0, 80, 90, 90), 1),
+    _sp("• Third item", (0, 60, 85, 70), 2),
+)
+ORDERED_LIST_SPANS = (
+    _sp("1. First item", (0, 100, 80, 110)),
+    _sp("2. Second item", (0, 80, 90, 90), 1),
+    _sp("3. Third item", (0, 60, 85, 70), 2),
+)
+MONOSPACE_CODE_SPANS = (
+    _sp("def hello():", (0, 100, 80, 110), font="Courier", size=10, flags=_MONO),
+    _sp("    print('hello')", (0, 80, 120, 90), 1, font="Courier", size=10, flags=_MONO),
+    _sp("    return True", (0, 60, 110, 70), 2, font="Courier", size=10, flags=_MONO),
+)
+MIXED_CONTENT_SPANS = (
+    # Paragraph
+    _sp("Introduction text", (0, 120, 100, 130)),
+    _sp("", (0, 110, 0, 115), 1),  # Empty line
+    # List
+    _sp("• First item", (0, 100, 80, 110), 2),
+    _sp("• Second item", (0, 90, 85, 100), 3),
+    _sp("", (0, 80, 0, 85), 4),  # Empty line
+    # Code block
+    _sp("    def function():", (40, 70, 120, 80), 5, font="Courier", size=10, flags=_MONO),
+    _sp("        return True", (80, 60, 150, 70), 6, font="Courier", size=10, flags=_MONO),
+)
+
+
+@pytest.mark.slow
+def test_assemble_blocks_empty_input(config):
+    """Test assemble_blocks with empty input."""
+    result = assemble_blocks([], config)
+    assert result == []
+
+
+@pytest.mark.slow
+def test_assemble_blocks_single_paragraph(config):
+    """Test assembling a single paragraph from consecutive text lines."""
+    spans = [
+        _sp("Hello world", (0, 100, 100, 110)),
+        _sp("This is a test", (0, 80, 120, 90), 1),
+        _sp("of paragraph assembly", (0, 60, 150, 70), 2),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH
+    # The block should have a valid bbox and page span
+    assert result[0].bbox != (0.0, 0.0, 0.0, 0.0)
+    assert result[0].page_span == (1, 1)
+
+
+@pytest.mark.slow
+def test_assemble_blocks_paragraph_with_empty_line(config):
+    """Test that empty lines create separate blocks and break paragraphs."""
+    spans = [
+        _sp("First paragraph", (0, 100, 100, 110)),
+        _sp("", (0, 80, 0, 90), 1),  # Empty line
+        _sp("Second paragraph", (0, 60, 120, 70), 2),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 3
+    assert result[0].block_type == BlockType.PARAGRAPH
+    assert result[1].block_type == BlockType.EMPTY_LINE
+    assert result[2].block_type == BlockType.PARAGRAPH
+
+
+@pytest.mark.slow
+def test_assemble_blocks_bullet_list_detection(config):
+    """Test that bullet list items are detected correctly."""
+    result = assemble_blocks(list(BULLET_LIST_SPANS), config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+
+@pytest.mark.slow
+def test_assemble_blocks_ordered_list_detection(config):
+    """Test that ordered list items are detected correctly."""
+    result = assemble_blocks(list(ORDERED_LIST_SPANS), config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+
+@pytest.mark.slow
+def test_assemble_blocks_code_block_detection_by_indent(config):
+    """Test that indented code blocks are detected when meeting minimum line threshold."""
+    # Use default config values: code_min_lines=2, code_indent_threshold=4
+    spans = [
+        _sp("    def hello():", (40, 100, 120, 110), font="Courier", size=10, flags=_MONO),
+        _sp("        print('hello')", (80, 80, 160, 90), 1, font="Courier", size=10, flags=_MONO),
+        _sp("        return True", (80, 60, 150, 70), 2, font="Courier", size=10, flags=_MONO),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK
+    assert "dedented_lines" in result[0].meta
+    # Check that indentation was removed properly
+    dedented = result[0].meta["dedented_lines"]
+    assert dedented[0] == "def hello():"
+    assert dedented[1] == "    print('hello')"
+    assert dedented[2] == "    return True"
+
+
+@pytest.mark.slow
+def test_assemble_blocks_insufficient_code_lines(config):
+    """Test that insufficient indented lines don't create a code block."""
+    # Only one indented line, but code_min_lines=2
+    spans = [
+        _sp("    single_line = True", (40, 100, 120, 110), font="Courier", size=10, flags=_MONO),
+        _sp("Regular paragraph text", (0, 80, 120, 90), 1),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH  # Not enough lines for code block
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("config_with", [{"code_min_lines": 3}], indirect=True)
+def test_assemble_blocks_respect_code_min_lines_config(config_with):
+    """Test that code_min_lines config parameter is respected."""
+    config = config_with  # Require 3 lines minimum
+
+    spans = [
+        _sp("    line1 = 1", (40, 100, 80, 110), font="Courier", size=10, flags=_MONO),
+        # Only 2 lines
+        _sp("    line2 = 2", (40, 80, 80, 90), 1, font="Courier", size=10, flags=_MONO),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert (
+        result[0].block_type == BlockType.PARAGRAPH
+    )  # Not enough for code block with higher threshold
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("config_with", [{"code_indent_threshold": 8}], indirect=True)
+def test_assemble_blocks_respect_code_indent_threshold(config_with):
+    """Test that code_indent_threshold config parameter is respected for non-monospace text."""
+    config = config_with  # Require more indentation
+
+    spans = [
+        # Use regular font (not monospace) so indentation threshold matters
+        _sp("    not_enough_indent", (40, 100, 120, 110), size=10),
+        _sp("    still_not_enough", (40, 80, 120, 90), 1, size=10),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH  # Not indented enough for code block
+
+
+@pytest.mark.slow
+def test_assemble_blocks_mixed_content(config):
+    """Test assembling mixed content: paragraph, list, and code block."""
+    result = assemble_blocks(list(MIXED_CONTENT_SPANS), config)
+    assert len(result) == 5  # paragraph, empty, list, empty, code
+    assert result[0].block_type == BlockType.PARAGRAPH
+    assert result[1].block_type == BlockType.EMPTY_LINE
+    assert result[2].block_type == BlockType.LIST
+    assert result[3].block_type == BlockType.EMPTY_LINE
+    assert result[4].block_type == BlockType.CODE_BLOCK
+
+
+@pytest.mark.slow
+def test_assemble_blocks_code_with_empty_lines(config):
+    """Test that empty lines within code blocks are preserved."""
+    spans = [
+        _sp("    def function():", (40, 100, 120, 110), font="Courier", size=10, flags=_MONO),
+        _sp("", (40, 90, 40, 95), 1, font="Courier", size=10, flags=_MONO),  # Empty line in code
+        _sp("        return True", (80, 80, 150, 90), 2, font="Courier", size=10, flags=_MONO),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK
+    dedented = result[0].meta["dedented_lines"]
+    assert len(dedented) == 3
+    assert dedented[0] == "def function():"
+    assert dedented[1] == ""  # Empty line preserved
+    assert dedented[2] == "    return True"
+
+
+@pytest.mark.slow
+def test_assemble_blocks_avoid_heading_false_positives(config):
+    """Test that numbered headings are not incorrectly classified as list items."""
+    # Test cases that should be treated as paragraphs, not list items
+    heading_spans = [
+        # Typical chapter headings that should not be lists
+        _sp("1. Introduction", (0, 100, 80, 110), size=14, flags=_BOLD),
+        _sp("2. Background", (0, 80, 90, 90), 1, size=14, flags=_BOLD),
+        _sp("3. Methodology", (0, 60, 85, 70), 2, size=14, flags=_BOLD),
+    ]
+
+    result = assemble_blocks(heading_spans, config)
+    # Should create one paragraph block (consecutive paragraphs get grouped)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH
+
+    # Test mixed case - actual list items should still be detected
+    mixed_spans = [
+        # This looks like a heading
+        _sp("1. Introduction", (0, 100, 80, 110), size=14, flags=_BOLD),
+        _sp("", (0, 80, 0, 80), 1),  # Empty line
+        # These look like actual list items
+        _sp("1. First task to complete", (0, 60, 120, 70), 2),
+        _sp("2. Second task in sequence", (0, 40, 130, 50), 3),
+    ]
+
+    result = assemble_blocks(mixed_spans, config)
+    assert len(result) == 3  # Paragraph, empty line, list
+    assert result[0].block_type == BlockType.PARAGRAPH  # The heading
+    assert result[1].block_type == BlockType.EMPTY_LINE
+    assert result[2].block_type == BlockType.LIST  # The actual list items
+
+
+@pytest.mark.slow
+def test_assemble_blocks_monospace_code_detection(config):
+    """Test that monospace spans are detected as code blocks."""
+    result = assemble_blocks(list(MONOSPACE_CODE_SPANS), config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK
+    # Check that code language detection is present
+    assert "code_language" in result[0].meta
+    assert result[0].meta["code_language"] is None  # Should be None for now
+
+
+@pytest.mark.slow
+def test_assemble_blocks_mixed_monospace_regular_text(config):
+    """Test mixed monospace and regular text - should detect code when mostly monospace."""
+    spans = [
+        # Line with mostly monospace text should be detected as code
+        _sp("def", (0, 100, 20, 110), font="Courier", size=10, flags=_MONO),
+        _sp(" ", (20, 100, 25, 110), 1),  # Regular space
+        _sp("function():", (25, 100, 80, 110), 2, font="Courier", size=10, flags=_MONO),
+        # Second line also mostly monospace
+        _sp("    return", (0, 80, 50, 90), 3, font="Courier", size=10, flags=_MONO),
+        _sp(" True", (50, 80, 80, 90), 4, font="Courier", size=10, flags=_MONO),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK
+
+
+@pytest.mark.slow
+def test_assemble_blocks_insufficient_monospace_lines(config):
+    """Test that insufficient monospace lines don't create a code block."""
+    # Only one monospace line, but code_min_lines=2
+    spans = [
+        _sp("single_line()", (0, 100, 80, 110), font="Courier", size=10, flags=_MONO),
+        _sp("Regular paragraph text", (0, 80, 120, 90), 1),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH  # Not enough lines for code block
+
+
+@pytest.mark.slow
+def test_assemble_blocks_monospace_and_indent_mixed(config):
+    """Test that both monospace and indented code detection work together."""
+    spans = [
+        # Monospace code without much indentation
+        _sp("function test() {", (0, 120, 100, 130), font="Courier", size=10, flags=_MONO),
+        # Indented code with regular font
+        _sp("    var x = 1;", (40, 100, 100, 110), 1, size=10),
+        _sp("    return x;", (40, 80, 90, 90), 2, size=10),
+        # Monospace closing
+        _sp("}", (0, 60, 10, 70), 3, font="Courier", size=10, flags=_MONO),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK
+
+
+@pytest.mark.slow
+def test_assemble_blocks_nested_bullet_lists(config):
+    """Test nested bullet list detection by x-offset."""
+    spans = [
+        # Top level items at x=10
+        _sp("• First item", (10, 120, 80, 130)),
+        # Nested item at x=30 (20 point offset)
+        _sp("  • Nested item", (30, 100, 100, 110), 1),
+        _sp("  • Another nested", (30, 80, 110, 90), 2),
+        # Back to top level
+        _sp("• Second item", (10, 60, 90, 70), 3),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+    # Check nesting structure
+    meta = result[0].meta
+    assert "list_items" in meta
+    list_items = meta["list_items"]
+    assert len(list_items) == 4
+
+    # Check nesting levels
+    assert list_items[0]["level"] == 0  # First item
+    assert list_items[1]["level"] == 1  # Nested item
+    assert list_items[2]["level"] == 1  # Another nested
+    assert list_items[3]["level"] == 0  # Second item
+
+    # Check max nesting level
+    assert meta["max_nesting_level"] == 1
+
+
+@pytest.mark.slow
+def test_assemble_blocks_nested_ordered_lists(config):
+    """Test nested ordered list detection by x-offset."""
+    spans = [
+        # Top level items at x=10
+        _sp("1. First item", (10, 120, 80, 130)),
+        # Nested items at x=30
+        _sp("  a. Nested item", (30, 100, 100, 110), 1),
+        _sp("  b. Another nested", (30, 80, 110, 90), 2),
+        # Back to top level
+        _sp("2. Second item", (10, 60, 90, 70), 3),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+    # Check nesting structure
+    meta = result[0].meta
+    list_items = meta["list_items"]
+    assert len(list_items) == 4
+
+    # Check nesting levels
+    assert list_items[0]["level"] == 0  # 1. First item
+    assert list_items[1]["level"] == 1  # a. Nested item
+    assert list_items[2]["level"] == 1  # b. Another nested
+    assert list_items[3]["level"] == 0  # 2. Second item
+
+
+@pytest.mark.slow
+def test_assemble_blocks_mixed_list_types_nesting(config):
+    """Test mixed bullet and ordered list nesting."""
+    spans = [
+        # Top level bullet at x=10
+        _sp("• Main topic", (10, 120, 80, 130)),
+        # Nested ordered list at x=30
+        _sp("  1. First subtopic", (30, 100, 120, 110), 1),
+        _sp("  2. Second subtopic", (30, 80, 130, 90), 2),
+        # Deeply nested bullet at x=50
+        _sp("    • Detail point", (50, 60, 110, 70), 3),
+        # Back to top level
+        _sp("• Another main topic", (10, 40, 120, 50), 4),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+    # Check nesting structure
+    meta = result[0].meta
+    list_items = meta["list_items"]
+    assert len(list_items) == 5
+
+    # Check nesting levels (should be based on x-position clusters)
+    assert list_items[0]["level"] == 0  # • Main topic (x=10)
+    assert list_items[1]["level"] == 1  # 1. First subtopic (x=30)
+    assert list_items[2]["level"] == 1  # 2. Second subtopic (x=30)
+    assert list_items[3]["level"] == 2  # • Detail point (x=50)
+    assert list_items[4]["level"] == 0  # • Another main topic (x=10)
+
+    # Check max nesting level
+    assert meta["max_nesting_level"] == 2
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("config_with", [{"list_indent_tolerance": 5}], indirect=True)
+def test_assemble_blocks_list_indent_tolerance_respected(config_with):
+    """Test that list_indent_tolerance is respected in nesting detection."""
+    # Use a smaller tolerance for this test
+    config = config_with
+
+    spans = [
+        # Items at x=10 and x=13 should be same level (within tolerance)
+        _sp("• First item", (10, 120, 80, 130)),
+        _sp("• Similar position", (13, 100, 100, 110), 1),
+        # Item at x=20 should be nested (outside tolerance)
+        _sp("  • Nested item", (20, 80, 100, 90), 2),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.LIST
+
+    # Check nesting structure
+    meta = result[0].meta
+    list_items = meta["list_items"]
+    assert len(list_items) == 3
+
+    # Items at x=10 and x=13 should have same level (within tolerance of 5)
+    assert list_items[0]["level"] == list_items[1]["level"]
+    # Item at x=20 should have different level (outside tolerance)
+    assert list_items[2]["level"] != list_items[0]["level"]
+
+
+@pytest.mark.slow
+def test_assemble_blocks_table_detection_high_confidence(config):
+    """Test table detection with high confidence."""
+    spans = [
+        # Header row with multiple columns separated by spaces
+        _sp("Name", (10, 120, 40, 130)),
+        _sp("Age", (80, 120, 100, 130), 1),
+        _sp("City", (150, 120, 180, 130), 2),
+        # Data row 1
+        _sp("John", (10, 100, 40, 110), 3),
+        _sp("25", (80, 100, 95, 110), 4),
+        _sp("NYC", (150, 100, 175, 110), 5),
+        # Data row 2
+        _sp("Alice", (10, 80, 45, 90), 6),
+        _sp("30", (80, 80, 95, 90), 7),
+        _sp("LA", (150, 80, 165, 90), 8),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.TABLE
+
+    # Check table metadata
+    meta = result[0].meta
+    assert "table_rows" in meta
+    assert "confidence" in meta
+    assert meta["confidence"] >= config.table_confidence_min
+    assert meta["format"] == "table"
+
+    # Check table structure
+    table_rows = meta["table_rows"]
+    assert len(table_rows) == 3  # Header + 2 data rows
+    assert table_rows[0] == ["Name", "Age", "City"]
+    assert table_rows[1] == ["John", "25", "NYC"]
+    assert table_rows[2] == ["Alice", "30", "LA"]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("config_with", [{"table_confidence_min": 0.8}], indirect=True)
+def test_assemble_blocks_table_fallback_low_confidence(config_with):
+    """Test table fallback to fenced code block when confidence is low."""
+    # Raise the confidence threshold to force the fallback
+    config = config_with
+
+    spans = [
+        # Ambiguous table-like content with adequate gaps but poor alignment
+        _sp("Item1", (10, 120, 45, 130)),
+        _sp("Value", (80, 120, 115, 130), 1),
+        # Second line with different structure but adequate gaps
+        _sp("DifferentItem", (10, 100, 80, 110), 2),
+        _sp("AnotherValue", (95, 100, 160, 110), 3),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.CODE_BLOCK  # Fallback to code block
+
+    # Check fallback metadata
+    meta = result[0].meta
+    assert meta["format"] == "fenced_fallback"
+    assert "original_confidence" in meta
+    assert meta["original_confidence"] < config.table_confidence_min
+    assert "dedented_lines" in meta
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("config_with", [{"table_confidence_min": 0.95}], indirect=True)
+def test_assemble_blocks_table_confidence_threshold_respected(config_with):
+    """Test that table_confidence_min threshold is respected."""
+    # Use a very high threshold
+    config = config_with
+
+    spans = [
+        # Good table structure but below very high threshold
+        _sp("A", (10, 120, 20, 130)),
+        _sp("B", (80, 120, 90, 130), 1),
+        _sp("1", (10, 100, 20, 110), 2),
+        _sp("2", (80, 100, 90, 110), 3),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    # Should fallback to code block due to high threshold
+    assert result[0].block_type == BlockType.CODE_BLOCK
+    assert result[0].meta["format"] == "fenced_fallback"
+
+
+@pytest.mark.slow
+def test_assemble_blocks_insufficient_table_rows(config):
+    """Test that insufficient rows don't create a table."""
+    spans = [
+        # Only one row - not enough for a table
+        _sp("Col1", (10, 120, 40, 130)),
+        _sp("Col2", (80, 120, 110, 130), 1),
+        # Regular paragraph follows
+        _sp("This is regular text", (10, 100, 150, 110), 2),
+    ]
+
+    result = assemble_blocks(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH  # Not enough rows for table
+
+
+@pytest.mark.slow
+def test_assemble_blocks_pages_matches_sequential(config):
+    """Test that the parallel per-page entry point matches per-page assembly.
+
+    Equivalence holds per page by construction; documents whose content
+    straddles a page break diverge from assemble_blocks, as pinned by
+    test_assemble_blocks_pages_splits_page_spanning_blocks below.
+    """
+    # Three pages so the process pool actually engages; plain dict flags so
+    # the spans pickle cleanly across workers
+    spans = [
+        Span("Page one text", (0, 100, 100, 110), "Arial", 12, {}, 1, 0),
+        Span("More page one", (0, 80, 100, 90), "Arial", 12, {}, 1, 1),
+        Span("• Item on page two", (0, 100, 120, 110), "Arial", 12, {}, 2, 2),
+        Span("• Second item", (0, 80, 100, 90), "Arial", 12, {}, 2, 3),
+        Span("Page three paragraph", (0, 100, 140, 110), "Arial", 12, {}, 3, 4),
+    ]
+
+    expected = []
+    for page in (1, 2, 3):
+        expected.extend(assemble_blocks([s for s in spans if s.page == page], config))
+
+    result = assemble_blocks_pages(spans, config, max_workers=2)
+    assert [b.block_type for b in result] == [b.block_type for b in expected]
+    assert [b.page_span for b in result] == [b.page_span for b in expected]
+
+
+def test_assemble_blocks_pages_small_input_inline(config):
+    """Test that small documents skip the process pool but produce blocks."""
+    spans = [
+        Span("Only page text", (0, 100, 100, 110), "Arial", 12, {}, 1, 0),
+    ]
+
+    result = assemble_blocks_pages(spans, config)
+    assert len(result) == 1
+    assert result[0].block_type == BlockType.PARAGRAPH
+
+
+def test_assemble_blocks_pages_splits_page_spanning_blocks(config):
+    """Pin the documented divergence from assemble_blocks at page breaks.
+
+    assemble_blocks merges a paragraph straddling a page break into one
+    block spanning both pages; the per-page entry point assembles pages in
+    isolation and therefore splits it into one block per page.
+    """
+    spans = [
+        Span("Paragraph starts on page one", (0, 100, 150, 110), "Arial", 12, {}, 1, 0),
+        Span("and continues on page two", (0, 80, 140, 90), "Arial", 12, {}, 2, 1),
+    ]
+
+    sequential = assemble_blocks(spans, config)
+    assert [(b.block_type, b.page_span) for b in sequential] == [(BlockType.PARAGRAPH, (1, 2))]
+
+    paged = assemble_blocks_pages(spans, config)
+    assert [(b.block_type, b.page_span) for b in paged] == [
+        (BlockType.PARAGRAPH, (1, 1)),
+        (BlockType.PARAGRAPH, (2, 2)),
+    ]
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-import importlib
 from pathlib import Path
 
 import pdfplumber
 
 
-def test_heading_positions_are_exact(tmp_path: Path) -> None:
-    gen = importlib.import_module("scripts.gen_fixtures")
-    out = tmp_path / "basic_headings.pdf"
-    gen.make_basic_headings(out)
+def test_heading_positions_are_exact(basic_pdf_bytes: tuple[Path, bytes]) -> None:
+    out, _ = basic_pdf_bytes
 
     with pdfplumber.open(out) as pdf:
         page = pdf.pages[0]
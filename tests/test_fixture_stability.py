@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import importlib
+import mmap
 from pathlib import Path
 
 
@@ -9,20 +10,20 @@ def sha256(p: Path) -> str:
     return hashlib.sha256(p.read_bytes()).hexdigest()
 
 
-def test_basic_pdf_is_byte_stable(tmp_path: Path) -> None:
+def test_basic_pdf_is_byte_stable(basic_pdf_bytes: tuple[Path, bytes], tmp_path: Path) -> None:
     gen = importlib.import_module("scripts.gen_fixtures")
-    out1 = tmp_path / "basic_headings_1.pdf"
+    out1, data1 = basic_pdf_bytes
     out2 = tmp_path / "basic_headings_2.pdf"
 
     # API: make_basic_headings(output_path: Path) -> Path
-    gen.make_basic_headings(out1)
     gen.make_basic_headings(out2)
 
-    h1, h2 = sha256(out1), sha256(out2)
+    h1, h2 = hashlib.sha256(data1).hexdigest(), sha256(out2)
     assert h1 == h2
 
-    # Check constant metadata tokens and embedded font name markers
-    data = out1.read_bytes()
-    assert b"pdf2md-fixtures" in data  # Producer tag
-    assert b"D:20240101000000Z" in data  # CreationDate
-    assert b"DejaVuSans" in data  # Embedded font name appears in PDF
+    # Check constant metadata tokens and embedded font name markers without
+    # copying the file into a Python bytes object.
+    with out1.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert mm.find(b"pdf2md-fixtures") != -1  # Producer tag
+        assert mm.find(b"D:20240101000000Z") != -1  # CreationDate
+        assert mm.find(b"DejaVuSans") != -1  # Embedded font name appears in PDF
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
 
 
@@ -10,5 +11,6 @@ def test_vendored_fonts_exist() -> None:
     assert (fonts / "DejaVuSansMono.ttf").exists()
     lic = fonts / "LICENSE.txt"
     assert lic.exists()
-    text = lic.read_text(encoding="utf-8", errors="ignore")
-    assert "DejaVu" in text
+    # Scan the mapped bytes directly instead of decoding the whole license.
+    with lic.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert mm.find(b"DejaVu") != -1
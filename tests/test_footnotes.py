@@ -0,0 +1,199 @@
+"""Tests for footnote detection and association functionality."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import cfg
+
+from pdf2md.config import ToolConfig
+from pdf2md.footnotes import (
+    associate_footnotes,
+    build_footnote_projections,
+    detect_footnote_text,
+)
+from pdf2md.models import Span
+
+# Letter-size page height in points; the default band ratio of 0.85 puts the
+# footnote band below y = 673.2
+PAGE_HEIGHT = 792.0
+
+# Module-level span table: Span is immutable, so instances are cached per slot
+# and shared across tests instead of being rebuilt for every test invocation.
+_SPAN_DB: dict[int, Span] = {}
+
+
+def s(
+    slot: int,
+    text: str,
+    bbox: tuple[float, float, float, float],
+    page: int = 1,
+    order_index: int = 0,
+    font_size: float = 8,
+) -> Span:
+    """Return the cached Span for a slot, constructing it on first use."""
+    return _SPAN_DB.setdefault(slot, Span(text, bbox, "Arial", font_size, {}, page, order_index))
+
+
+@pytest.fixture(scope="module")
+def config() -> ToolConfig:
+    """Create the default test configuration once per module.
+
+    The config is only ever read; tests needing different settings construct
+    their own ToolConfig instance (see test_footnote_merge_configuration).
+    """
+    return ToolConfig()
+
+
+def test_detect_footnote_text_bottom_band(config: ToolConfig) -> None:
+    """Test that only spans in the bottom band become footnotes."""
+    spans = [
+        s(0, "Body paragraph text", (72, 300, 400, 312), order_index=0, font_size=10),
+        s(1, "1 A footnote in the bottom band", (72, 700, 300, 710), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    assert len(footnotes) == 1
+    assert footnotes[0].marker == "1"
+    assert footnotes[0].text == "A footnote in the bottom band"
+    assert footnotes[0].page == 1
+
+
+def test_detect_footnote_text_requires_marker(config: ToolConfig) -> None:
+    """Test that unmarked band text (e.g. page numbers) is not a footnote."""
+    spans = [
+        s(2, "42", (280, 730, 300, 740), order_index=0),
+        s(3, "Running footer text", (72, 745, 200, 755), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    assert footnotes == []
+
+
+def test_detect_footnote_text_multiple_markers(config: ToolConfig) -> None:
+    """Test detection of several footnotes on one page."""
+    spans = [
+        s(4, "1 First footnote", (72, 700, 250, 710), order_index=0),
+        s(5, "2 Second footnote", (72, 712, 250, 722), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    assert [f.marker for f in footnotes] == ["1", "2"]
+    assert [f.text for f in footnotes] == ["First footnote", "Second footnote"]
+
+
+def test_detect_footnote_text_merges_continuation_lines(config: ToolConfig) -> None:
+    """Test that unmarked band lines are merged into the open footnote."""
+    spans = [
+        s(6, "3 Start of a longer footnote", (72, 700, 300, 710), order_index=0),
+        s(7, "that continues on a second line", (72, 712, 290, 722), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    assert len(footnotes) == 1
+    assert footnotes[0].text == "Start of a longer footnote that continues on a second line"
+    assert len(footnotes[0].spans) == 2
+    # Merged bbox is the union of both line bboxes
+    assert footnotes[0].bbox == (72, 700, 300, 722)
+
+
+@pytest.mark.parametrize(
+    ("merge", "expected_text"),
+    [
+        (True, "Merged footnote start and its continuation"),
+        (False, "Merged footnote start"),
+    ],
+)
+def test_footnote_merge_configuration(merge: bool, expected_text: str) -> None:
+    """Test that footnote_merge controls continuation-line merging."""
+    spans = [
+        s(8, "4 Merged footnote start", (72, 700, 300, 710), order_index=0),
+        s(9, "and its continuation", (72, 712, 250, 722), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, cfg(footnote_merge=merge))
+    assert len(footnotes) == 1
+    assert footnotes[0].text == expected_text
+
+
+def test_associate_footnotes_bracketed_reference(config: ToolConfig) -> None:
+    """Test association of bracketed in-text markers."""
+    spans = [
+        s(10, "See note [1] for details", (72, 300, 300, 312), order_index=0, font_size=10),
+        s(11, "1 The referenced footnote", (72, 700, 300, 710), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    references = associate_footnotes(spans, footnotes, config)
+    assert len(references) == 1
+    assert references[0].marker == "1"
+    assert references[0].footnote.text == "The referenced footnote"
+    assert references[0].span.text == "See note [1] for details"
+
+
+def test_associate_footnotes_superscript_style_reference(config: ToolConfig) -> None:
+    """Test association of a digit glued to the preceding word."""
+    spans = [
+        s(12, "as previously shown2", (72, 300, 300, 312), order_index=0, font_size=10),
+        s(13, "2 Supporting evidence", (72, 700, 300, 710), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    references = associate_footnotes(spans, footnotes, config)
+    assert len(references) == 1
+    assert references[0].marker == "2"
+    assert references[0].footnote.text == "Supporting evidence"
+
+
+@pytest.mark.slow
+def test_associate_footnotes_unknown_marker(config: ToolConfig) -> None:
+    """Test that markers without a matching footnote produce no reference."""
+    spans = [
+        s(14, "See note [9] for details", (72, 300, 300, 312), order_index=0, font_size=10),
+        s(15, "1 An unrelated footnote", (72, 700, 300, 710), order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    references = associate_footnotes(spans, footnotes, config)
+    assert references == []
+
+
+@pytest.mark.slow
+def test_associate_footnotes_page_scoped(config: ToolConfig) -> None:
+    """Test that a marker only binds to a footnote on the same page."""
+    spans = [
+        s(16, "See note [1] for details", (72, 300, 300, 312), page=2, order_index=0),
+        s(17, "1 Footnote on page one", (72, 700, 300, 710), page=1, order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    references = associate_footnotes(spans, footnotes, config)
+    assert references == []
+
+
+@pytest.mark.slow
+def test_associate_footnotes_skips_footnote_spans(config: ToolConfig) -> None:
+    """Test that a footnote's own text is never treated as a reference."""
+    spans = [
+        s(18, "1 Compare with note [1] itself", (72, 700, 300, 710), order_index=0),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    references = associate_footnotes(spans, footnotes, config)
+    assert len(footnotes) == 1
+    assert references == []
+
+
+def test_build_footnote_projections(config: ToolConfig) -> None:
+    """Test building footnote projections for manifest."""
+    spans = [
+        s(19, "1 First footnote", (72, 700, 250, 710), order_index=0),
+        s(20, "2 Second footnote", (72, 712, 250, 722), page=1, order_index=1),
+    ]
+
+    footnotes = detect_footnote_text(spans, PAGE_HEIGHT, config)
+    projections = build_footnote_projections(footnotes)
+
+    assert projections == [
+        {"id": "fn_0000", "text": "First footnote", "page": 1},
+        {"id": "fn_0001", "text": "Second footnote", "page": 1},
+    ]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 
 from pdf2md.build_tree import build_tree
@@ -9,117 +12,122 @@ from pdf2md.config import ToolConfig
 from pdf2md.headings import assign_heading_levels, detect_heading_level
 from pdf2md.models import Block, BlockType, SectionNode, Span
 
+# Shared immutable style mappings so span literals below don't allocate a
+# fresh dict each (and mutation attempts fail loudly)
+_BOLD: Mapping[str, bool] = MappingProxyType({"bold": True})
+_PLAIN: Mapping[str, bool] = MappingProxyType({})
+
+
+def _span(text, bbox, size=12, style=_BOLD, page=1, idx=0):
+    """Build an Arial Span; headings here are bold by default."""
+    return Span(text, bbox, "Arial", size, style, page, idx)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def config():
-    """Provide a default ToolConfig for tests."""
+    """Provide a default ToolConfig shared across this module's tests.
+
+    The config is only ever read; tests needing different settings construct
+    their own ToolConfig instance.
+    """
     return ToolConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_spans():
-    """Provide sample spans for testing."""
-    return {
-        "chapter1": [
-            Span("Chapter 1 Introduction", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)
-        ],
-        "section1_1": [Span("1.1 Background", (0, 80, 150, 90), "Arial", 12, {"bold": True}, 1, 1)],
-        "section1_2": [
-            Span("1.2 Methodology", (0, 60, 180, 70), "Arial", 12, {"bold": True}, 1, 2)
-        ],
-        "subsection1_2_1": [
-            Span("1.2.1 Data Collection", (0, 40, 200, 50), "Arial", 10, {"bold": True}, 1, 3)
-        ],
-        "chapter2": [
-            Span("Chapter 2 Results", (0, 20, 160, 30), "Arial", 14, {"bold": True}, 1, 4)
-        ],
-        "all_caps": [Span("METHODOLOGY", (0, 200, 120, 210), "Arial", 12, {"bold": True}, 1, 5)],
-        "paragraph": [
-            Span(
+    """Provide sample spans for testing, built once per module.
+
+    Span is frozen, so sharing the instances across tests is safe; attribute
+    access on the namespace replaces per-test dict lookups.
+    """
+    return SimpleNamespace(
+        chapter1=(_span("Chapter 1 Introduction", (0, 100, 200, 110), 14),),
+        section1_1=(_span("1.1 Background", (0, 80, 150, 90), idx=1),),
+        section1_2=(_span("1.2 Methodology", (0, 60, 180, 70), idx=2),),
+        subsection1_2_1=(_span("1.2.1 Data Collection", (0, 40, 200, 50), 10, idx=3),),
+        chapter2=(_span("Chapter 2 Results", (0, 20, 160, 30), 14, idx=4),),
+        all_caps=(_span("METHODOLOGY", (0, 200, 120, 210), idx=5),),
+        paragraph=(
+            _span(
                 "This is a regular paragraph of text that should not be detected as a heading.",
                 (0, 180, 400, 190),
-                "Arial",
                 11,
-                {},
-                1,
-                6,
-            )
-        ],
-    }
+                style=_PLAIN,
+                idx=6,
+            ),
+        ),
+    )
 
 
 # Tests for Task 5.1: Regex and uppercase heuristics
 
 
-def test_detect_heading_level_chapter(config):
-    """Test that Chapter headings are detected as level 1."""
-    assert detect_heading_level("Chapter 1 Introduction", config) == 1
-    assert detect_heading_level("Chapter 10 Conclusion", config) == 1
-    assert detect_heading_level("CHAPTER 5 ANALYSIS", config) == 1
-
-
-def test_detect_heading_level_dotted_numbering(config):
-    """Test that dotted numbering is detected with correct levels."""
-    assert detect_heading_level("1. Introduction", config) == 1
-    assert detect_heading_level("1.1 Background", config) == 2
-    assert detect_heading_level("1.2 Methodology", config) == 2
-    assert detect_heading_level("1.2.1 Data Collection", config) == 3
-    assert detect_heading_level("1.2.3.4 Detailed Analysis", config) == 4
-    assert detect_heading_level("2.1.3.4.5.6.7", config) == 6  # Capped at 6 levels
-
-
-def test_detect_heading_level_all_caps(config):
-    """Test that ALL-CAPS headings are detected as level 1."""
-    assert detect_heading_level("METHODOLOGY", config) == 1
-    assert detect_heading_level("INTRODUCTION AND BACKGROUND", config) == 1
-    assert detect_heading_level("RESULTS", config) == 1
-
-
-def test_detect_heading_level_part_and_appendix(config):
-    """Test that Part and Appendix headings are detected as level 1."""
-    assert detect_heading_level("Part I Overview", config) == 1
-    assert detect_heading_level("Part II Analysis", config) == 1
-    assert detect_heading_level("Appendix A Data Tables", config) == 1
-    assert detect_heading_level("Appendix B Code Listings", config) == 1
-
-
-def test_detect_heading_level_non_headings(config):
-    """Test that regular text is not detected as headings."""
-    assert detect_heading_level("This is a regular paragraph.", config) is None
-    assert (
-        detect_heading_level(
-            "A very long paragraph that exceeds the length threshold for heading "
-            "detection and should not be considered a heading candidate.",
-            config,
-        )
-        is None
-    )
-    assert detect_heading_level("", config) is None
-    assert detect_heading_level("   ", config) is None
-
-
-def test_detect_heading_level_edge_cases(config):
-    """Test edge cases for heading detection."""
-    # Short all-caps words (should still pass due to is_heading_candidate)
-    assert detect_heading_level("ABC DEF", config) == 1
-
-    # Mixed case that doesn't match patterns and doesn't pass is_heading_candidate
-    assert detect_heading_level("Introduction", config) is None  # Doesn't pass is_heading_candidate
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # Chapter headings are level 1
+        ("Chapter 1 Introduction", 1),
+        ("Chapter 10 Conclusion", 1),
+        ("CHAPTER 5 ANALYSIS", 1),
+        # Dotted numbering maps depth to level
+        ("1. Introduction", 1),
+        ("1.1 Background", 2),
+        ("1.2 Methodology", 2),
+        ("1.2.1 Data Collection", 3),
+        ("1.2.3.4 Detailed Analysis", 4),
+        ("2.1.3.4.5.6.7", 6),  # Capped at 6 levels
+        # ALL-CAPS headings are level 1
+        ("METHODOLOGY", 1),
+        ("INTRODUCTION AND BACKGROUND", 1),
+        ("RESULTS", 1),
+        # Part and Appendix headings are level 1
+        ("Part I Overview", 1),
+        ("Part II Analysis", 1),
+        ("Appendix A Data Tables", 1),
+        ("Appendix B Code Listings", 1),
+        # Short all-caps words (should still pass due to is_heading_candidate)
+        ("ABC DEF", 1),
+    ],
+)
+def test_detect_heading_level_headings(config, text, expected):
+    """Test that heading patterns are detected with the correct level."""
+    assert detect_heading_level(text, config) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "This is a regular paragraph.",
+        "A very long paragraph that exceeds the length threshold for heading "
+        "detection and should not be considered a heading candidate.",
+        "",
+        "   ",
+        # Mixed case that doesn't match patterns and doesn't pass is_heading_candidate
+        "Introduction",
+    ],
+)
+def test_detect_heading_level_non_headings(config, text):
+    """Test that regular text is not detected as a heading."""
+    assert detect_heading_level(text, config) is None
+
+
+def test_heading_patterns_are_precompiled():
+    """Regression test: heading patterns stay module-level compiled regexes."""
+    import re
+
+    from pdf2md import headings
+
+    assert headings._HEADING_PATTERNS
+    assert all(isinstance(p, re.Pattern) for p in headings._HEADING_PATTERNS)
 
 
 def test_assign_heading_levels_mixed_content(config, sample_spans):
     """Test assigning levels to a mix of heading candidates and regular blocks."""
     blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(BlockType.PARAGRAPH, sample_spans["paragraph"], (0, 180, 400, 190), (1, 1), {}),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_1"], (0, 80, 150, 90), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["all_caps"], (0, 200, 120, 210), (1, 1), {}
-        ),
+        Block(BlockType.HEADING_CANDIDATE, sample_spans.chapter1, (0, 100, 200, 110), (1, 1), {}),
+        Block(BlockType.PARAGRAPH, sample_spans.paragraph, (0, 180, 400, 190), (1, 1), {}),
+        Block(BlockType.HEADING_CANDIDATE, sample_spans.section1_1, (0, 80, 150, 90), (1, 1), {}),
+        Block(BlockType.HEADING_CANDIDATE, sample_spans.all_caps, (0, 200, 120, 210), (1, 1), {}),
     ]
 
     headings = assign_heading_levels(blocks, config)
@@ -141,7 +149,7 @@ def test_assign_heading_levels_empty_input(config):
 def test_assign_heading_levels_no_heading_candidates(config, sample_spans):
     """Test assign_heading_levels with no heading candidate blocks."""
     blocks = [
-        Block(BlockType.PARAGRAPH, sample_spans["paragraph"], (0, 180, 400, 190), (1, 1), {}),
+        Block(BlockType.PARAGRAPH, sample_spans.paragraph, (0, 180, 400, 190), (1, 1), {}),
     ]
 
     headings = assign_heading_levels(blocks, config)
@@ -151,19 +159,22 @@ def test_assign_heading_levels_no_heading_candidates(config, sample_spans):
 # Tests for Task 5.2: Tree build and freeze points
 
 
+def _hc(sample_spans, key):
+    """Build a HeadingCandidate block whose bbox mirrors its first span."""
+    spans = getattr(sample_spans, key)
+    return Block(BlockType.HEADING_CANDIDATE, spans, spans[0].bbox, (1, 1), {})
+
+
+@pytest.fixture(scope="module")
+def canonical_tree(config, sample_spans):
+    """Build the five-heading tree shared by the traversal and freeze tests."""
+    keys = ("chapter1", "section1_1", "section1_2", "subsection1_2_1", "chapter2")
+    return build_tree([_hc(sample_spans, key) for key in keys], config)
+
+
 def test_build_tree_simple_hierarchy(config, sample_spans):
     """Test building a simple two-level hierarchy."""
-    blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_1"], (0, 80, 150, 90), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_2"], (0, 60, 180, 70), (1, 1), {}
-        ),
-    ]
+    blocks = [_hc(sample_spans, key) for key in ("chapter1", "section1_1", "section1_2")]
 
     tree = build_tree(blocks, config)
 
@@ -184,20 +195,7 @@ def test_build_tree_simple_hierarchy(config, sample_spans):
 def test_build_tree_multi_level_hierarchy(config, sample_spans):
     """Test building a three-level hierarchy."""
     blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_2"], (0, 60, 180, 70), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE,
-            sample_spans["subsection1_2_1"],
-            (0, 40, 200, 50),
-            (1, 1),
-            {},
-        ),
-        Block(BlockType.HEADING_CANDIDATE, sample_spans["chapter2"], (0, 20, 160, 30), (1, 1), {}),
+        _hc(sample_spans, key) for key in ("chapter1", "section1_2", "subsection1_2_1", "chapter2")
     ]
 
     tree = build_tree(blocks, config)
@@ -227,36 +225,19 @@ def test_build_tree_multi_level_hierarchy(config, sample_spans):
     assert len(chapter2.children) == 0
 
 
-def test_build_tree_preorder_traversal(config, sample_spans):
+def test_build_tree_preorder_traversal(canonical_tree):
     """Test that children follow parents in pre-order traversal."""
-    blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_1"], (0, 80, 150, 90), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_2"], (0, 60, 180, 70), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE,
-            sample_spans["subsection1_2_1"],
-            (0, 40, 200, 50),
-            (1, 1),
-            {},
-        ),
-        Block(BlockType.HEADING_CANDIDATE, sample_spans["chapter2"], (0, 20, 160, 30), (1, 1), {}),
-    ]
+    tree = canonical_tree
 
-    tree = build_tree(blocks, config)
-
-    # Manual pre-order traversal
+    # Manual pre-order traversal with an explicit stack (no recursion, one
+    # output list)
     def traverse_preorder(sections):
         result = []
-        for section in sections:
-            result.append(section)
-            result.extend(traverse_preorder(section.children))
+        stack = list(reversed(sections))
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            stack.extend(reversed(node.children))
         return result
 
     preorder = traverse_preorder(tree)
@@ -270,18 +251,9 @@ def test_build_tree_preorder_traversal(config, sample_spans):
     assert preorder[4].title == "Chapter 2 Results"
 
 
-def test_build_tree_freeze_functionality(config, sample_spans):
+def test_build_tree_freeze_functionality(canonical_tree):
     """Test that nodes are frozen after tree building."""
-    blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_1"], (0, 80, 150, 90), (1, 1), {}
-        ),
-    ]
-
-    tree = build_tree(blocks, config)
+    tree = canonical_tree
 
     root = tree[0]
     child = root.children[0]
@@ -307,7 +279,7 @@ def test_build_tree_empty_input(config):
 def test_build_tree_no_headings(config, sample_spans):
     """Test build_tree with no heading candidates."""
     blocks = [
-        Block(BlockType.PARAGRAPH, sample_spans["paragraph"], (0, 180, 400, 190), (1, 1), {}),
+        Block(BlockType.PARAGRAPH, sample_spans.paragraph, (0, 180, 400, 190), (1, 1), {}),
     ]
 
     tree = build_tree(blocks, config)
@@ -316,14 +288,7 @@ def test_build_tree_no_headings(config, sample_spans):
 
 def test_section_node_slug_generation(config, sample_spans):
     """Test that slugs are generated deterministically with proper prefixes."""
-    blocks = [
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["chapter1"], (0, 100, 200, 110), (1, 1), {}
-        ),
-        Block(
-            BlockType.HEADING_CANDIDATE, sample_spans["section1_1"], (0, 80, 150, 90), (1, 1), {}
-        ),
-    ]
+    blocks = [_hc(sample_spans, key) for key in ("chapter1", "section1_1")]
 
     tree = build_tree(blocks, config)
 
@@ -339,9 +304,9 @@ def test_section_node_slug_collision_handling(config):
     """Test that duplicate section titles get collision suffixes."""
     # Create spans with identical titles that would create the same base slug
     # Using ALL CAPS to ensure they're detected as headings
-    duplicate_spans1 = [Span("INTRODUCTION", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)]
-    duplicate_spans2 = [Span("INTRODUCTION", (0, 80, 150, 90), "Arial", 14, {"bold": True}, 1, 1)]
-    duplicate_spans3 = [Span("INTRODUCTION", (0, 60, 180, 70), "Arial", 14, {"bold": True}, 1, 2)]
+    duplicate_spans1 = [_span("INTRODUCTION", (0, 100, 200, 110), 14)]
+    duplicate_spans2 = [_span("INTRODUCTION", (0, 80, 150, 90), 14, idx=1)]
+    duplicate_spans3 = [_span("INTRODUCTION", (0, 60, 180, 70), 14, idx=2)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, duplicate_spans1, (0, 100, 200, 110), (1, 1), {}),
@@ -363,10 +328,10 @@ def test_section_node_slug_collision_handling(config):
 def test_section_node_slug_collision_mixed_titles(config):
     """Test collision handling with mixed unique and duplicate titles."""
     # Using ALL CAPS to ensure they're detected as headings
-    spans1 = [Span("INTRODUCTION", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)]
-    spans2 = [Span("METHODOLOGY", (0, 80, 150, 90), "Arial", 14, {"bold": True}, 1, 1)]
-    spans3 = [Span("INTRODUCTION", (0, 60, 180, 70), "Arial", 14, {"bold": True}, 1, 2)]
-    spans4 = [Span("RESULTS", (0, 40, 200, 50), "Arial", 14, {"bold": True}, 1, 3)]
+    spans1 = [_span("INTRODUCTION", (0, 100, 200, 110), 14)]
+    spans2 = [_span("METHODOLOGY", (0, 80, 150, 90), 14, idx=1)]
+    spans3 = [_span("INTRODUCTION", (0, 60, 180, 70), 14, idx=2)]
+    spans4 = [_span("RESULTS", (0, 40, 200, 50), 14, idx=3)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, spans1, (0, 100, 200, 110), (1, 1), {}),
@@ -389,14 +354,10 @@ def test_section_node_slug_collision_mixed_titles(config):
 def test_section_node_slug_collision_stable_ordering(config):
     """Test that collision numbering follows stable pre-order traversal."""
     # Create a hierarchical structure with duplicate titles to test stable ordering
-    chapter1_spans = [
-        Span("Chapter 1 Analysis", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)
-    ]
-    section1_spans = [Span("1.1 Overview", (0, 80, 150, 90), "Arial", 12, {"bold": True}, 1, 1)]
-    chapter2_spans = [
-        Span("Chapter 2 Analysis", (0, 60, 180, 70), "Arial", 14, {"bold": True}, 1, 2)
-    ]
-    section2_spans = [Span("2.1 Overview", (0, 40, 200, 50), "Arial", 12, {"bold": True}, 1, 3)]
+    chapter1_spans = [_span("Chapter 1 Analysis", (0, 100, 200, 110), 14)]
+    section1_spans = [_span("1.1 Overview", (0, 80, 150, 90), idx=1)]
+    chapter2_spans = [_span("Chapter 2 Analysis", (0, 60, 180, 70), 14, idx=2)]
+    section2_spans = [_span("2.1 Overview", (0, 40, 200, 50), idx=3)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, chapter1_spans, (0, 100, 200, 110), (1, 1), {}),
@@ -422,14 +383,10 @@ def test_section_node_slug_collision_stable_ordering(config):
 def test_section_node_slug_collision_hierarchical_duplicates(config):
     """Test collision handling with actual duplicate base slugs in hierarchical structure."""
     # Use titles that will create the same base slug after normalization
-    chapter1_spans = [
-        Span("Chapter 1 Overview", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)
-    ]
-    section1_spans = [Span("1.1 Overview", (0, 80, 150, 90), "Arial", 12, {"bold": True}, 1, 1)]
-    chapter2_spans = [
-        Span("Chapter 2 Results", (0, 60, 180, 70), "Arial", 14, {"bold": True}, 1, 2)
-    ]
-    section2_spans = [Span("2.1 Overview", (0, 40, 200, 50), "Arial", 12, {"bold": True}, 1, 3)]
+    chapter1_spans = [_span("Chapter 1 Overview", (0, 100, 200, 110), 14)]
+    section1_spans = [_span("1.1 Overview", (0, 80, 150, 90), idx=1)]
+    chapter2_spans = [_span("Chapter 2 Results", (0, 60, 180, 70), 14, idx=2)]
+    section2_spans = [_span("2.1 Overview", (0, 40, 200, 50), idx=3)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, chapter1_spans, (0, 100, 200, 110), (1, 1), {}),
@@ -454,9 +411,9 @@ def test_section_node_slug_collision_hierarchical_duplicates(config):
 def test_section_node_slug_collision_actual_duplicates(config):
     """Test collision handling with titles that actually produce the same base slug."""
     # Create titles that normalize to the same base slug: "overview"
-    spans1 = [Span("OVERVIEW", (0, 100, 200, 110), "Arial", 14, {"bold": True}, 1, 0)]
-    spans2 = [Span("OVERVIEW", (0, 80, 150, 90), "Arial", 14, {"bold": True}, 1, 1)]
-    spans3 = [Span("OVERVIEW", (0, 60, 180, 70), "Arial", 14, {"bold": True}, 1, 2)]
+    spans1 = [_span("OVERVIEW", (0, 100, 200, 110), 14)]
+    spans2 = [_span("OVERVIEW", (0, 80, 150, 90), 14, idx=1)]
+    spans3 = [_span("OVERVIEW", (0, 60, 180, 70), 14, idx=2)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, spans1, (0, 100, 200, 110), (1, 1), {}),
@@ -478,8 +435,8 @@ def test_section_node_slug_collision_actual_duplicates(config):
 def test_section_node_pages_assignment(config, sample_spans):
     """Test that page ranges are correctly assigned to SectionNodes."""
     # Create spans on different pages
-    chapter_spans = [Span("Chapter 1", (0, 100, 100, 110), "Arial", 14, {"bold": True}, 2, 0)]
-    section_spans = [Span("1.1 Background", (0, 80, 150, 90), "Arial", 12, {"bold": True}, 3, 1)]
+    chapter_spans = [_span("Chapter 1", (0, 100, 100, 110), 14, page=2)]
+    section_spans = [_span("1.1 Background", (0, 80, 150, 90), page=3, idx=1)]
 
     blocks = [
         Block(BlockType.HEADING_CANDIDATE, chapter_spans, (0, 100, 100, 110), (2, 2), {}),
@@ -500,9 +457,7 @@ def test_section_node_pages_assignment(config, sample_spans):
 
 def test_chapter_numbering_metadata_attached(config):
     """Test that chapter numbering metadata is attached to blocks."""
-    chapter_spans = [
-        Span("Chapter 1 Introduction", (0, 10, 200, 20), "Arial", 14, {"bold": True}, 1, 0)
-    ]
+    chapter_spans = [_span("Chapter 1 Introduction", (0, 10, 200, 20), 14)]
     chapter_block = Block(BlockType.HEADING_CANDIDATE, chapter_spans, (0, 10, 200, 20), (1, 1), {})
 
     headings = assign_heading_levels([chapter_block], config)
@@ -517,7 +472,7 @@ def test_chapter_numbering_metadata_attached(config):
 
 def test_section_path_metadata_attached(config):
     """Test that section path metadata is attached to blocks."""
-    section_spans = [Span("1.2.3 Methodology", (0, 10, 200, 20), "Arial", 12, {"bold": True}, 1, 0)]
+    section_spans = [_span("1.2.3 Methodology", (0, 10, 200, 20))]
     section_block = Block(BlockType.HEADING_CANDIDATE, section_spans, (0, 10, 200, 20), (1, 1), {})
 
     headings = assign_heading_levels([section_block], config)
@@ -533,13 +488,11 @@ def test_section_path_metadata_attached(config):
 def test_appendix_metadata_attached(config):
     """Test that appendix metadata is attached to blocks."""
     # First need a chapter to enable appendix detection
-    chapter_spans = [
-        Span("Chapter 1 Introduction", (0, 10, 200, 20), "Arial", 14, {"bold": True}, 1, 0)
-    ]
+    chapter_spans = [_span("Chapter 1 Introduction", (0, 10, 200, 20), 14)]
     chapter_block = Block(BlockType.HEADING_CANDIDATE, chapter_spans, (0, 10, 200, 20), (1, 1), {})
 
     # Appendix at top of page (y=10 is near top)
-    appendix_spans = [Span("Appendix A Data", (0, 10, 200, 20), "Arial", 14, {"bold": True}, 2, 0)]
+    appendix_spans = [_span("Appendix A Data", (0, 10, 200, 20), 14, page=2)]
     appendix_block = Block(
         BlockType.HEADING_CANDIDATE, appendix_spans, (0, 10, 200, 20), (2, 2), {}
     )
@@ -565,7 +518,7 @@ def test_global_chapter_numbering_across_parts_integration(config):
         # Part I
         Block(
             BlockType.HEADING_CANDIDATE,
-            [Span("Part I Overview", (0, 10, 200, 20), "Arial", 16, {"bold": True}, 1, 0)],
+            [_span("Part I Overview", (0, 10, 200, 20), 16)],
             (0, 10, 200, 20),
             (1, 1),
             {},
@@ -573,7 +526,7 @@ def test_global_chapter_numbering_across_parts_integration(config):
         # Chapter 1
         Block(
             BlockType.HEADING_CANDIDATE,
-            [Span("Chapter 1 Introduction", (0, 10, 200, 20), "Arial", 14, {"bold": True}, 2, 0)],
+            [_span("Chapter 1 Introduction", (0, 10, 200, 20), 14, page=2)],
             (0, 10, 200, 20),
             (2, 2),
             {},
@@ -581,7 +534,7 @@ def test_global_chapter_numbering_across_parts_integration(config):
         # Part II
         Block(
             BlockType.HEADING_CANDIDATE,
-            [Span("Part II Analysis", (0, 10, 200, 20), "Arial", 16, {"bold": True}, 3, 0)],
+            [_span("Part II Analysis", (0, 10, 200, 20), 16, page=3)],
             (0, 10, 200, 20),
             (3, 3),
             {},
@@ -589,7 +542,7 @@ def test_global_chapter_numbering_across_parts_integration(config):
         # Chapter 1 again (should get global number 2)
         Block(
             BlockType.HEADING_CANDIDATE,
-            [Span("Chapter 1 Methodology", (0, 10, 200, 20), "Arial", 14, {"bold": True}, 4, 0)],
+            [_span("Chapter 1 Methodology", (0, 10, 200, 20), 14, page=4)],
             (0, 10, 200, 20),
             (4, 4),
             {},
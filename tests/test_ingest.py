@@ -2,15 +2,66 @@
 
 from __future__ import annotations
 
-import tempfile
+from collections.abc import Mapping
+from io import BytesIO
+from itertools import pairwise
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
+from conftest import extract_spans_cached
 
 from pdf2md.config import ToolConfig
 from pdf2md.ingest import PdfIngestor
 from pdf2md.models import Span
 
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "pdfs"
+BASIC_HEADINGS_PDF = FIXTURE_DIR / "basic_headings.pdf"
+MULTIPAGE_PDF = FIXTURE_DIR / "multipage.pdf"
+
+# Stat the fixtures once at collection; dependent tests skip up-front instead
+# of paying fixture setup before a late pytest.skip
+requires_basic_pdf = pytest.mark.skipif(
+    not BASIC_HEADINGS_PDF.exists(), reason=f"Test fixture not found: {BASIC_HEADINGS_PDF}"
+)
+requires_multipage_pdf = pytest.mark.skipif(
+    not MULTIPAGE_PDF.exists(), reason=f"Multi-page test fixture not found: {MULTIPAGE_PDF}"
+)
+
+
+@pytest.fixture(scope="session")
+def basic_headings_bytes() -> bytes:
+    """Read basic_headings.pdf into memory once per session."""
+    return BASIC_HEADINGS_PDF.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def multipage_bytes() -> bytes:
+    """Read multipage.pdf into memory once per session."""
+    return MULTIPAGE_PDF.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def basic_headings_spans() -> list[Span]:
+    """Extract spans from basic_headings.pdf once per session.
+
+    PDF parsing dominates this module's runtime; read-only tests share the
+    default-config extraction, served from the on-disk parse cache when warm.
+    """
+    return extract_spans_cached(BASIC_HEADINGS_PDF)
+
+
+@pytest.fixture(scope="session")
+def multipage_spans() -> list[Span]:
+    """Extract spans from multipage.pdf once per session."""
+    return extract_spans_cached(MULTIPAGE_PDF)
+
+
+@pytest.fixture(scope="session")
+def default_ingestor() -> PdfIngestor:
+    """Provide one default-config PdfIngestor shared by stateless tests."""
+    return PdfIngestor(ToolConfig())
+
 
 class TestPdfIngestor:
     """Test cases for PdfIngestor class."""
@@ -21,18 +72,13 @@ class TestPdfIngestor:
         ingestor = PdfIngestor(config)
         assert ingestor.config is config
 
-    def test_extract_spans_with_basic_headings_fixture(self) -> None:
+    @pytest.mark.slow
+    @requires_basic_pdf
+    def test_extract_spans_with_basic_headings_fixture(
+        self, basic_headings_spans: list[Span]
+    ) -> None:
         """Test spans extraction from basic_headings.pdf fixture."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        # Skip test if fixture doesn't exist
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
+        spans = basic_headings_spans
 
         # Basic validation
         assert isinstance(spans, list)
@@ -48,63 +94,34 @@ class TestPdfIngestor:
             assert isinstance(span.font_name, str)
             assert isinstance(span.font_size, float)
             assert span.font_size > 0
-            assert isinstance(span.style_flags, dict)
+            assert isinstance(span.style_flags, Mapping)
             assert isinstance(span.page, int)
             assert span.page > 0
             assert isinstance(span.order_index, int)
 
-    def test_order_index_strictly_increasing(self) -> None:
+    @requires_basic_pdf
+    def test_order_index_strictly_increasing(self, basic_headings_spans: list[Span]) -> None:
         """Test that order_index values are strictly increasing across all pages."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
-
         # Extract order indices
-        order_indices = [span.order_index for span in spans]
+        order_indices = [span.order_index for span in basic_headings_spans]
 
-        # Check strictly increasing
-        for i in range(1, len(order_indices)):
-            assert order_indices[i] > order_indices[i - 1], (
-                f"Order index not strictly increasing: {order_indices[i - 1]} >= "
-                f"{order_indices[i]} at position {i}"
-            )
+        # Check strictly increasing in a single pairwise pass
+        assert all(b > a for a, b in pairwise(order_indices)), (
+            f"Order index not strictly increasing: {order_indices}"
+        )
 
-    def test_non_empty_spans_only(self) -> None:
+    @requires_basic_pdf
+    def test_non_empty_spans_only(self, basic_headings_spans: list[Span]) -> None:
         """Test that only non-empty spans are produced."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
-
         # All spans should have non-empty text
-        for span in spans:
+        for span in basic_headings_spans:
             assert span.text.strip(), f"Found span with empty text: {span.text!r}"
 
-    def test_style_flags_structure(self) -> None:
+    @requires_basic_pdf
+    def test_style_flags_structure(self, basic_headings_spans: list[Span]) -> None:
         """Test that style_flags includes bold, italic, and mono keys."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
-
         # All spans should have style_flags with bold, italic, and mono
-        for span in spans:
+        for span in basic_headings_spans:
             assert "bold" in span.style_flags
             assert "italic" in span.style_flags
             assert "mono" in span.style_flags
@@ -112,156 +129,103 @@ class TestPdfIngestor:
             assert isinstance(span.style_flags["italic"], bool)
             assert isinstance(span.style_flags["mono"], bool)
 
-    def test_exclude_pages_multipage_functionality(self) -> None:
+    @pytest.mark.slow
+    @requires_multipage_pdf
+    def test_exclude_pages_multipage_functionality(
+        self, multipage_spans: list[Span], multipage_bytes: bytes
+    ) -> None:
         """Test exclude_pages with multi-page PDF."""
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "multipage.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Multi-page test fixture not found: {fixture_path}")
+        # Normal behavior (all pages, default config via shared fixture)
+        all_spans = multipage_spans
 
-        # Test normal behavior (all pages)
-        config = ToolConfig(exclude_pages=[])
-        ingestor = PdfIngestor(config)
-        all_spans = ingestor.extract_spans(fixture_path)
+        # Should have spans from all 3 pages; harvest pages once in C via
+        # attrgetter + frozenset
+        get_page = attrgetter("page")
+        pages_found = frozenset(map(get_page, all_spans))
+        assert pages_found >= {1, 2, 3}, "Should have spans from pages 1-3"
 
-        # Should have spans from all 3 pages
-        pages_found = {span.page for span in all_spans}
-        assert 1 in pages_found, "Should have spans from page 1"
-        assert 2 in pages_found, "Should have spans from page 2"
-        assert 3 in pages_found, "Should have spans from page 3"
-
-        # Test excluding page 2
+        # Test excluding page 2, reusing the in-memory document
         config = ToolConfig(exclude_pages=[2])
         ingestor = PdfIngestor(config)
-        filtered_spans = ingestor.extract_spans(fixture_path)
+        filtered_spans = ingestor.extract_spans(BytesIO(multipage_bytes))
 
         # Should have spans from pages 1 and 3, but not 2
-        pages_found = {span.page for span in filtered_spans}
-        assert 1 in pages_found, "Should have spans from page 1"
+        pages_found = frozenset(map(get_page, filtered_spans))
+        assert pages_found >= {1, 3}, "Should have spans from pages 1 and 3"
         assert 2 not in pages_found, "Should not have spans from page 2"
-        assert 3 in pages_found, "Should have spans from page 3"
 
         # Should have fewer spans than all pages
         assert len(filtered_spans) < len(all_spans), "Should have fewer spans when excluding a page"
 
-    def test_exclude_pages_functionality(self) -> None:
+    @requires_basic_pdf
+    def test_exclude_pages_functionality(self, basic_headings_bytes: bytes) -> None:
         """Test that pages in exclude_pages are skipped."""
         # Test with page 1 excluded (basic_headings.pdf has 1 page)
         config = ToolConfig(exclude_pages=[1])
         ingestor = PdfIngestor(config)
 
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
+        spans = ingestor.extract_spans(BytesIO(basic_headings_bytes))
 
         # Should be empty since page 1 is excluded
         assert len(spans) == 0, "Should have no spans when page 1 is excluded"
 
-    def test_exclude_pages_no_effect_on_nonexistent_pages(self) -> None:
+    @requires_basic_pdf
+    def test_exclude_pages_no_effect_on_nonexistent_pages(
+        self, basic_headings_bytes: bytes
+    ) -> None:
         """Test that excluding non-existent pages has no effect."""
         # Exclude page 99 (doesn't exist in basic_headings.pdf)
         config = ToolConfig(exclude_pages=[99])
         ingestor = PdfIngestor(config)
 
-        fixture_path = Path(__file__).parent / "fixtures" / "pdfs" / "basic_headings.pdf"
-
-        if not fixture_path.exists():
-            pytest.skip(f"Test fixture not found: {fixture_path}")
-
-        spans = ingestor.extract_spans(fixture_path)
+        spans = ingestor.extract_spans(BytesIO(basic_headings_bytes))
 
         # Should still have spans since we only excluded a non-existent page
         assert len(spans) > 0, "Should have spans when excluding non-existent page"
 
-    def test_file_not_found_error(self) -> None:
+    def test_file_not_found_error(self, default_ingestor: PdfIngestor, tmp_path: Path) -> None:
         """Test FileNotFoundError for non-existent PDF."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        # Use tempfile for safer temporary path handling
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            non_existent_path = Path(tmp_dir) / "non_existent_file.pdf"
+        non_existent_path = tmp_path / "non_existent_file.pdf"
 
-            with pytest.raises(FileNotFoundError, match="PDF file not found"):
-                ingestor.extract_spans(non_existent_path)
+        with pytest.raises(FileNotFoundError, match="PDF file not found"):
+            default_ingestor.extract_spans(non_existent_path)
 
-    def test_invalid_pdf_error(self) -> None:
+    @pytest.mark.slow
+    def test_invalid_pdf_error(self, default_ingestor: PdfIngestor, tmp_path: Path) -> None:
         """Test ValueError for invalid PDF content."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        # Create a temporary file with invalid PDF content
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-            tmp_file.write(b"This is not a valid PDF file")
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            with pytest.raises(ValueError, match="Failed to read PDF"):
-                ingestor.extract_spans(tmp_path)
-        finally:
-            tmp_path.unlink()  # Clean up
-
-    def test_detect_style_flags_bold_font_names(self) -> None:
-        """Test style flags detection for bold font names."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        # Test various bold font name patterns
-        bold_fonts = ["Arial-Bold", "Times-Black", "DejaVu-Heavy", "SomeFont-Thick"]
-
-        for font_name in bold_fonts:
-            style_flags = ingestor._detect_style_flags(font_name, [])
-            assert style_flags["bold"], f"Should detect bold for font: {font_name}"
-            assert not style_flags["italic"], f"Should not detect italic for font: {font_name}"
-            assert not style_flags["mono"], f"Should not detect mono for font: {font_name}"
-
-    def test_detect_style_flags_italic_font_names(self) -> None:
-        """Test style flags detection for italic font names."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        # Test various italic font name patterns
-        italic_fonts = ["Arial-Italic", "Times-Oblique", "DejaVu-Slant"]
-
-        for font_name in italic_fonts:
-            style_flags = ingestor._detect_style_flags(font_name, [])
-            assert style_flags["italic"], f"Should detect italic for font: {font_name}"
-            assert not style_flags["bold"], f"Should not detect bold for font: {font_name}"
-            assert not style_flags["mono"], f"Should not detect mono for font: {font_name}"
-
-    def test_detect_style_flags_regular_font_names(self) -> None:
-        """Test style flags detection for regular font names."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        # Test regular font names
-        regular_fonts = ["Arial", "Times-Roman", "DejaVuSans", "Helvetica"]
-
-        for font_name in regular_fonts:
-            style_flags = ingestor._detect_style_flags(font_name, [])
-            assert not style_flags["bold"], f"Should not detect bold for font: {font_name}"
-            assert not style_flags["italic"], f"Should not detect italic for font: {font_name}"
-            assert not style_flags["mono"], f"Should not detect mono for font: {font_name}"
-
-    def test_detect_style_flags_empty_font_name(self) -> None:
-        """Test style flags detection with empty font name."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        style_flags = ingestor._detect_style_flags("", [])
-        assert not style_flags["bold"]
-        assert not style_flags["italic"]
-        assert not style_flags["mono"]
-
-    def test_detect_style_flags_mono_font_names(self) -> None:
-        """Test style flags detection for monospace font names."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
-
-        mono_fonts = [
+        bad_pdf = tmp_path / "bad.pdf"
+        bad_pdf.write_bytes(b"This is not a valid PDF file")
+
+        with pytest.raises(ValueError, match="Failed to read PDF"):
+            default_ingestor.extract_spans(bad_pdf)
+
+    @pytest.mark.parametrize(
+        ("font_name", "bold", "italic"),
+        [
+            ("Arial-Bold", True, False),
+            ("Times-Black", True, False),
+            ("DejaVu-Heavy", True, False),
+            ("SomeFont-Thick", True, False),
+            ("Arial-Italic", False, True),
+            ("Times-Oblique", False, True),
+            ("DejaVu-Slant", False, True),
+            ("Arial", False, False),
+            ("Times-Roman", False, False),
+            ("DejaVuSans", False, False),
+            ("Helvetica", False, False),
+            ("", False, False),
+        ],
+    )
+    def test_detect_style_flags(
+        self, default_ingestor: PdfIngestor, font_name: str, bold: bool, italic: bool
+    ) -> None:
+        """Test bold/italic style flag detection across font-name patterns."""
+        style_flags = default_ingestor._detect_style_flags(font_name, [])
+        assert style_flags == {"bold": bold, "italic": italic, "mono": False}
+
+    @pytest.mark.parametrize(
+        "font_name",
+        [
             "Courier",
             "CourierNew",
             "courier",
@@ -276,18 +240,18 @@ class TestPdfIngestor:
             "Lucida Console",
             "Fixed-Width",
             "Typewriter",
-        ]
-
-        for font_name in mono_fonts:
-            style_flags = ingestor._detect_style_flags(font_name, [])
-            assert style_flags["mono"], f"Should detect mono for font: {font_name}"
-
-    def test_detect_style_flags_non_mono_font_names(self) -> None:
-        """Test style flags detection for non-monospace font names."""
-        config = ToolConfig()
-        ingestor = PdfIngestor(config)
+        ],
+    )
+    def test_detect_style_flags_mono_font_names(
+        self, default_ingestor: PdfIngestor, font_name: str
+    ) -> None:
+        """Test style flags detection for monospace font names."""
+        style_flags = default_ingestor._detect_style_flags(font_name, [])
+        assert style_flags["mono"], f"Should detect mono for font: {font_name}"
 
-        non_mono_fonts = [
+    @pytest.mark.parametrize(
+        "font_name",
+        [
             "Arial",
             "Helvetica",
             "Times",
@@ -299,8 +263,11 @@ class TestPdfIngestor:
             "Calibri",
             "Cambria",
             "Century Gothic",
-        ]
-
-        for font_name in non_mono_fonts:
-            style_flags = ingestor._detect_style_flags(font_name, [])
-            assert not style_flags["mono"], f"Should not detect mono for font: {font_name}"
+        ],
+    )
+    def test_detect_style_flags_non_mono_font_names(
+        self, default_ingestor: PdfIngestor, font_name: str
+    ) -> None:
+        """Test style flags detection for non-monospace font names."""
+        style_flags = default_ingestor._detect_style_flags(font_name, [])
+        assert not style_flags["mono"], f"Should not detect mono for font: {font_name}"
@@ -0,0 +1,242 @@
+"""Tests for line merging and hyphenation repair functionality."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import make_span as _sp
+
+from pdf2md.structure import iter_merged_lines, merge_lines
+
+
+@pytest.mark.parametrize(
+    ("spans", "expected"),
+    [
+        pytest.param([], (), id="empty-input"),
+        pytest.param(
+            [_sp("Hello world", (0, 100, 100, 110))],
+            ("Hello world",),
+            id="single-span",
+        ),
+        pytest.param(
+            [
+                _sp("Hello", (0, 100, 50, 110)),
+                _sp("world", (60, 100, 100, 110), 1),
+                _sp("test", (110, 100, 140, 110), 2),
+            ],
+            ("Hello world test",),
+            id="same-line-multiple-spans",
+        ),
+        pytest.param(
+            [
+                # First line at y=100, second line at y=80
+                _sp("Hello", (0, 100, 50, 110)),
+                _sp("world", (60, 100, 100, 110), 1),
+                _sp("This is", (0, 80, 60, 90), 2),
+                _sp("a test", (70, 80, 120, 90), 3),
+            ],
+            ("Hello world", "This is a test"),
+            id="multiple-lines",
+        ),
+        pytest.param(
+            [
+                _sp("  Hello  ", (0, 100, 50, 110)),
+                _sp("  world  ", (60, 100, 100, 110), 1),
+            ],
+            ("Hello world",),
+            id="whitespace-normalized",
+        ),
+        pytest.param(
+            [
+                _sp("Hello", (0, 100, 50, 110)),
+                _sp("   ", (55, 100, 60, 110), 1),  # Empty
+                _sp("world", (60, 100, 100, 110), 2),
+            ],
+            ("Hello world",),
+            id="skip-empty-spans",
+        ),
+        pytest.param(
+            [
+                _sp("Hello", (0, 100, 50, 110)),
+                _sp("   ", (55, 100, 70, 110), 1),  # Multiple spaces
+                _sp("world", (75, 100, 110, 110), 2),
+            ],
+            ("Hello world",),
+            id="multiple-spaces-normalized",
+        ),
+        pytest.param(
+            [
+                # Spans on same line but in wrong x-order
+                _sp("world", (60, 100, 100, 110), 1),
+                _sp("Hello", (0, 100, 50, 110)),
+            ],
+            ("Hello world",),  # Should be reordered by x-coordinate
+            id="left-to-right-ordering",
+        ),
+        pytest.param(
+            [
+                # Lines supplied out of order; order_index wins, not y
+                _sp("Third", (0, 60, 50, 70), 4),
+                _sp("First", (0, 100, 50, 110)),
+                _sp("Second", (0, 80, 60, 90), 2),
+            ],
+            ("First", "Second", "Third"),
+            id="ordering-preserved",
+        ),
+    ],
+)
+def test_merge_lines_cases(config, spans, expected):
+    """Test merge_lines grouping, ordering and whitespace behavior."""
+    assert tuple(merge_lines(spans, config)) == expected
+
+
+@pytest.mark.parametrize(
+    ("spans", "expected"),
+    [
+        pytest.param(
+            [
+                # Hyphen + lowercase continuation: repair
+                _sp("transfor-", (0, 100, 80, 110)),
+                _sp("mation", (0, 80, 60, 90), 1),
+            ],
+            ("transformation",),
+            id="repair-lowercase",
+        ),
+        pytest.param(
+            [
+                # Uppercase continuation: keep the hyphen
+                _sp("some-", (0, 100, 50, 110)),
+                _sp("Thing", (0, 80, 60, 90), 1),
+            ],
+            ("some-Thing",),
+            id="no-repair-uppercase",
+        ),
+        pytest.param(
+            [
+                _sp("transfor-", (0, 100, 80, 110)),
+                _sp("mation", (0, 80, 60, 90), 1),
+                _sp("some-", (0, 60, 50, 70), 2),
+                _sp("Thing", (0, 40, 60, 50), 3),
+            ],
+            ("transformation", "some-Thing"),
+            id="mixed-case",
+        ),
+        pytest.param(
+            [
+                _sp("This is transfor-", (0, 100, 150, 110)),
+                _sp("mation of text", (0, 80, 120, 90), 1),
+                _sp("Another line", (0, 60, 100, 70), 2),
+            ],
+            ("This is transformation of text", "Another line"),
+            id="multi-word-lines",
+        ),
+        pytest.param(
+            [
+                # The hyphenation regex requires 3+ characters, so "a-" won't match
+                _sp("a-", (0, 100, 20, 110)),
+                _sp("test", (0, 80, 40, 90), 1),
+            ],
+            ("a-", "test"),
+            id="short-words-ignored",
+        ),
+        pytest.param(
+            [
+                # Trailing hyphen with no continuation line is dropped
+                _sp("transfor-", (0, 100, 80, 110)),
+            ],
+            ("transfor",),
+            id="no-following-line",
+        ),
+    ],
+)
+def test_merge_lines_hyphenation_cases(config, spans, expected):
+    """Test hyphenation repair across line boundaries."""
+    assert tuple(merge_lines(spans, config)) == expected
+
+
+def test_merge_lines_y_tolerance(config):
+    """Test that spans with slightly different y-coordinates are merged."""
+    spans = [
+        # Spans with slightly different y-coordinates (within tolerance)
+        _sp("Hello", (0, 100, 50, 110)),
+        _sp("world", (60, 102, 100, 112), 1),  # y slightly different
+    ]
+    result = merge_lines(spans, config)
+    assert result == ["Hello world"]
+
+
+def test_merge_lines_y_tolerance_exceeded(config):
+    """Test that spans with very different y-coordinates are not merged."""
+    spans = [
+        # Spans with y-coordinates that exceed tolerance
+        _sp("Hello", (0, 100, 50, 110)),
+        _sp("world", (60, 90, 100, 100), 1),  # y difference > tolerance
+    ]
+    result = merge_lines(spans, config)
+    assert result == ["Hello", "world"]
+
+
+def test_merge_lines_punctuation_no_space_before_hyphen(config):
+    """Test that hyphen spans are joined without preceding space for hyphenation repair."""
+    spans = [
+        # Word span followed by separate hyphen span
+        _sp("transfor", (0, 100, 70, 110)),
+        _sp("-", (71, 100, 75, 110), 1),
+        # Next line starts with lowercase for hyphenation repair
+        _sp("mation", (0, 80, 60, 90), 2),
+    ]
+    result = merge_lines(spans, config)
+    # Should produce "transfor-" on first line, then "mation"
+    # which gets repaired to "transformation"
+    assert result == ["transformation"]
+
+
+def test_merge_lines_punctuation_no_space_before_period(config):
+    """Test that period spans are joined without preceding space."""
+    spans = [
+        _sp("Hello world", (0, 100, 80, 110)),
+        _sp(".", (81, 100, 85, 110), 1),
+        _sp("This is next", (0, 80, 100, 90), 2),
+    ]
+    result = merge_lines(spans, config)
+    assert result == ["Hello world.", "This is next"]
+
+
+def test_merge_lines_punctuation_mixed_with_normal_spacing(config):
+    """Test mixing of punctuation and normal spans with appropriate spacing."""
+    spans = [
+        _sp("Hello", (0, 100, 50, 110)),
+        _sp(",", (51, 100, 55, 110), 1),  # Punctuation
+        _sp("world", (60, 100, 100, 110), 2),  # Normal word
+        _sp("!", (101, 100, 105, 110), 3),  # Punctuation
+    ]
+    result = merge_lines(spans, config)
+    assert result == ["Hello, world!"]
+
+
+@pytest.mark.parametrize("config_with", [{"line_merge_y_tolerance": 1.0}], indirect=True)
+def test_merge_lines_custom_y_tolerance(config_with):
+    """Test that custom y_tolerance from config is respected."""
+    # Use a smaller tolerance
+    config = config_with
+
+    spans = [
+        # Spans with y-coordinates that would merge with default tolerance but not with smaller
+        _sp("Hello", (0, 100, 50, 110)),
+        _sp("world", (60, 102, 100, 112), 1),  # y difference = 2.0
+    ]
+    result = merge_lines(spans, config)
+    # With tolerance = 1.0, these should NOT merge (difference > 1.0)
+    assert result == ["Hello", "world"]
+
+
+def test_iter_merged_lines_streams_and_matches(config):
+    """Test that the streaming API yields lazily and matches merge_lines."""
+    spans = [
+        _sp("transfor-", (0, 100, 80, 110)),
+        _sp("mation", (0, 80, 60, 90), 1),
+        _sp("Another line", (0, 60, 100, 70), 2),
+    ]
+
+    stream = iter_merged_lines(spans, config)
+    assert iter(stream) is stream  # Lazy iterator, not a list
+    assert list(stream) == merge_lines(spans, config)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -12,39 +12,42 @@ from pdf2md.models import SectionNode
 from pdf2md.render import generate_filename, render_section_stub, render_sections
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config() -> ToolConfig:
     """Create test configuration with default settings."""
     return ToolConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def custom_config() -> ToolConfig:
     """Create test configuration with custom settings."""
     return ToolConfig(slug_prefix_width=3, default_slug_fallback="no-title")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_section() -> SectionNode:
     """Create a simple section without prefix in slug."""
     return SectionNode(title="Intro", level=1, slug="intro")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def prefixed_section() -> SectionNode:
     """Create a section with prefixed slug (as generated by build_tree)."""
     return SectionNode(title="Data Analysis", level=1, slug="01-data-analysis")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def section_without_slug() -> SectionNode:
     """Create a section without a slug."""
     return SectionNode(title="No Slug Section", level=1, slug=None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def nested_sections() -> list[SectionNode]:
-    """Create nested sections for hierarchy testing."""
+    """Create nested sections for hierarchy testing.
+
+    Built once per module; render_sections only reads the tree.
+    """
     parent = SectionNode(title="Parent Chapter", level=1, slug="parent-chapter")
     child = SectionNode(title="Child Section", level=2, slug="child-section")
     parent.add_child(child)
@@ -121,64 +124,65 @@ class TestRenderSectionStub:
         assert content == "# Analysis & Results\n"
 
 
+@pytest.fixture(scope="module")
+def rendered_simple(
+    tmp_path_factory: pytest.TempPathFactory, config: ToolConfig, simple_section: SectionNode
+) -> tuple[Path, list[Path]]:
+    """Render the simple section once for the tests that only inspect output."""
+    output_dir = tmp_path_factory.mktemp("render")
+    written_files = render_sections([simple_section], output_dir, config)
+    return output_dir, written_files
+
+
 class TestRenderSections:
     """Tests for rendering multiple sections to files."""
 
-    def test_creates_book_directory(self, config: ToolConfig, simple_section: SectionNode) -> None:
+    def test_creates_book_directory(self, rendered_simple: tuple[Path, list[Path]]) -> None:
         """Test that render_sections creates book subdirectory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections([simple_section], output_dir, config)
+        output_dir, written_files = rendered_simple
 
-            book_dir = output_dir / "book"
-            assert book_dir.exists()
-            assert book_dir.is_dir()
-            assert len(written_files) == 1
+        book_dir = output_dir / "book"
+        assert book_dir.exists()
+        assert book_dir.is_dir()
+        assert len(written_files) == 1
 
-    def test_custom_book_subdir_name(self, config: ToolConfig, simple_section: SectionNode) -> None:
+    def test_custom_book_subdir_name(
+        self, tmp_path: Path, config: ToolConfig, simple_section: SectionNode
+    ) -> None:
         """Test rendering with custom book subdirectory name."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections(
-                [simple_section], output_dir, config, book_subdir="chapters"
-            )
-
-            chapters_dir = output_dir / "chapters"
-            assert chapters_dir.exists()
-            assert len(written_files) == 1
-            # Verify files are in the custom directory
-            for file_path in written_files:
-                assert file_path.parent.name == "chapters"
+        output_dir = tmp_path
+        written_files = render_sections(
+            [simple_section], output_dir, config, book_subdir="chapters"
+        )
+
+        chapters_dir = output_dir / "chapters"
+        assert chapters_dir.exists()
+        assert len(written_files) == 1
+        # Verify files are in the custom directory
+        for file_path in written_files:
+            assert file_path.parent.name == "chapters"
 
     def test_filename_and_content_generation(
-        self, config: ToolConfig, nested_sections: list[SectionNode]
+        self, tmp_path: Path, config: ToolConfig, nested_sections: list[SectionNode]
     ) -> None:
         """Test that files are created with correct names and contents."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections(nested_sections, output_dir, config)
-
-            assert len(written_files) == 2  # 1 parent + 1 child section
-
-            # Check filenames follow expected pattern (pre-order traversal)
-            expected_filenames = [
-                "01-parent-chapter.md",  # Parent section
-                "02-child-section.md",  # Child section
-            ]
+        output_dir = tmp_path
+        written_files = render_sections(nested_sections, output_dir, config)
 
-            actual_filenames = [f.name for f in written_files]
-            assert actual_filenames == expected_filenames
+        assert len(written_files) == 2  # 1 parent + 1 child section
 
-            # Check file contents
-            for file_path in written_files:
-                content = file_path.read_text(encoding="utf-8")
+        # Check filenames and contents in one pass (pre-order traversal);
+        # compare raw bytes since the expected payloads are ASCII
+        expected = {
+            "01-parent-chapter.md": b"# Parent Chapter\n",  # Parent section
+            "02-child-section.md": b"# Child Section\n",  # Child section
+        }
 
-                if file_path.name == "01-parent-chapter.md":
-                    assert content == "# Parent Chapter\n"
-                elif file_path.name == "02-child-section.md":
-                    assert content == "# Child Section\n"
+        assert [f.name for f in written_files] == list(expected)
+        for file_path in written_files:
+            assert file_path.read_bytes() == expected[file_path.name]
 
-    def test_preorder_traversal_ordering(self, config: ToolConfig) -> None:
+    def test_preorder_traversal_ordering(self, tmp_path: Path, config: ToolConfig) -> None:
         """Test that sections are processed in pre-order (parent before children)."""
         # Create deeper hierarchy to test traversal order
         root = SectionNode(title="Root", level=1, slug="root")
@@ -191,83 +195,95 @@ class TestRenderSections:
         root.add_child(child2)
         child1.add_child(grandchild)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections([root], output_dir, config)
+        output_dir = tmp_path
+        written_files = render_sections([root], output_dir, config)
 
-            # Should be: root, child1, grandchild, child2 (pre-order)
-            expected_filenames = [
-                "01-root.md",
-                "02-child-1.md",
-                "03-grandchild.md",
-                "04-child-2.md",
-            ]
+        # Should be: root, child1, grandchild, child2 (pre-order)
+        expected_filenames = [
+            "01-root.md",
+            "02-child-1.md",
+            "03-grandchild.md",
+            "04-child-2.md",
+        ]
 
-            actual_filenames = [f.name for f in written_files]
-            assert actual_filenames == expected_filenames
+        actual_filenames = [f.name for f in written_files]
+        assert actual_filenames == expected_filenames
 
-    def test_relative_paths_are_correct(
-        self, config: ToolConfig, simple_section: SectionNode
-    ) -> None:
+    def test_relative_paths_are_correct(self, rendered_simple: tuple[Path, list[Path]]) -> None:
         """Test that returned file paths are relative to output directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections([simple_section], output_dir, config)
-
-            # All files should be under book/ subdirectory
-            for file_path in written_files:
-                rel_path = file_path.relative_to(output_dir)
-                assert rel_path.parts[0] == "book"
-                assert len(rel_path.parts) == 2  # book/{filename}.md
-                assert rel_path.suffix == ".md"
-
-    def test_empty_sections_list(self, config: ToolConfig) -> None:
+        output_dir, written_files = rendered_simple
+
+        # All files should be directly under book/ with a .md suffix; one
+        # string prefix/suffix check replaces the per-path relative_to walk
+        book_prefix = f"{output_dir}{os.sep}book{os.sep}"
+        for file_path in written_files:
+            path_str = str(file_path)
+            assert path_str.startswith(book_prefix)
+            assert path_str.endswith(".md")
+            assert os.sep not in path_str[len(book_prefix) :]  # no deeper nesting
+
+    def test_empty_sections_list(self, tmp_path: Path, config: ToolConfig) -> None:
         """Test rendering with empty sections list."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections([], output_dir, config)
+        output_dir = tmp_path
+        written_files = render_sections([], output_dir, config)
 
-            # Should create book directory but no files
-            book_dir = output_dir / "book"
-            assert book_dir.exists()
-            assert len(written_files) == 0
+        # Should create book directory but no files
+        book_dir = output_dir / "book"
+        assert book_dir.exists()
+        assert len(written_files) == 0
 
-    def test_file_writing_utf8_encoding(self, config: ToolConfig) -> None:
+    def test_file_writing_utf8_encoding(self, tmp_path: Path, config: ToolConfig) -> None:
         """Test that files are written with UTF-8 encoding."""
         section = SectionNode(title="Résumé & Café", level=1, slug="resume-cafe")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections([section], output_dir, config)
+        output_dir = tmp_path
+        written_files = render_sections([section], output_dir, config)
+
+        assert len(written_files) == 1
+        content = written_files[0].read_text(encoding="utf-8")
+        assert content == "# Résumé & Café\n"
+
+    def test_injected_writer_keeps_rendering_in_memory(
+        self, config: ToolConfig, simple_section: SectionNode
+    ) -> None:
+        """Test that an injected writer captures output without touching disk."""
+        sink: dict[Path, str] = {}
+        output_dir = Path("/nonexistent-render-root")
+
+        written_files = render_sections(
+            [simple_section], output_dir, config, writer=sink.__setitem__
+        )
 
-            assert len(written_files) == 1
-            content = written_files[0].read_text(encoding="utf-8")
-            assert content == "# Résumé & Café\n"
+        # Nothing was created on disk; all content went to the sink
+        assert not output_dir.exists()
+        assert written_files == [output_dir / "book" / "01-intro.md"]
+        assert sink == {output_dir / "book" / "01-intro.md": "# Intro\n"}
 
 
 class TestIntegrationScenario:
     """Integration tests matching the issue requirements."""
 
-    def test_issue_scenario_exact_match(self, config: ToolConfig) -> None:
+    def test_issue_scenario_exact_match(self, tmp_path: Path, config: ToolConfig) -> None:
         """Test exact scenario from issue: section with title 'Intro' generates correct file."""
         # Given a section with title "Intro"
         section = SectionNode(title="Intro", level=1, slug="intro")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
+        output_dir = tmp_path
 
-            # When rendering Markdown
-            written_files = render_sections([section], output_dir, config)
+        # When rendering Markdown
+        written_files = render_sections([section], output_dir, config)
 
-            # Then file `book/01-intro.md` exists with heading line
-            expected_file = output_dir / "book" / "01-intro.md"
-            assert expected_file.exists()
-            assert expected_file in written_files
+        # Then file `book/01-intro.md` exists with heading line
+        expected_file = output_dir / "book" / "01-intro.md"
+        assert expected_file.exists()
+        assert expected_file in written_files
 
-            content = expected_file.read_text(encoding="utf-8")
-            assert content == "# Intro\n"
+        content = expected_file.read_text(encoding="utf-8")
+        assert content == "# Intro\n"
 
-    def test_multiple_sections_for_comprehensive_validation(self, config: ToolConfig) -> None:
+    def test_multiple_sections_for_comprehensive_validation(
+        self, tmp_path: Path, config: ToolConfig
+    ) -> None:
         """Test with 2-3 sections as required by definition of done."""
         # Create 3 sections to test comprehensive behavior
         sections = [
@@ -276,22 +292,34 @@ class TestIntegrationScenario:
             SectionNode(title="Results", level=1, slug="results"),
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            written_files = render_sections(sections, output_dir, config)
-
-            # Verify all files exist with correct names
-            expected_files = [
-                output_dir / "book" / "01-introduction.md",
-                output_dir / "book" / "02-methodology.md",
-                output_dir / "book" / "03-results.md",
-            ]
-
-            for expected_file in expected_files:
-                assert expected_file.exists()
-                assert expected_file in written_files
-
-            # Verify contents
-            assert expected_files[0].read_text() == "# Introduction\n"
-            assert expected_files[1].read_text() == "# Methodology\n"
-            assert expected_files[2].read_text() == "# Results\n"
+        output_dir = tmp_path
+        written_files = render_sections(sections, output_dir, config)
+
+        # Verify all files exist with the right names and byte contents
+        expected = {
+            output_dir / "book" / "01-introduction.md": b"# Introduction\n",
+            output_dir / "book" / "02-methodology.md": b"# Methodology\n",
+            output_dir / "book" / "03-results.md": b"# Results\n",
+        }
+
+        for expected_file, payload in expected.items():
+            assert expected_file in written_files
+            assert expected_file.read_bytes() == payload
+
+
+def test_duplicate_filenames_last_write_wins(tmp_path: Path, config: ToolConfig) -> None:
+    """Test that sections colliding on a filename publish once, last write winning."""
+    # Pre-prefixed slugs bypass the index prefix, so both sections map to
+    # the same file, as direct writes always resolved via overwrite
+    sections = [
+        SectionNode(title="First", level=1, slug="01-intro"),
+        SectionNode(title="Second", level=1, slug="01-intro"),
+    ]
+
+    written_files = render_sections(sections, tmp_path, config)
+
+    target = tmp_path / "book" / "01-intro.md"
+    assert written_files == [target, target]
+    assert target.read_bytes() == b"# Second\n"
+    # No staging leftovers beside the published file
+    assert [p.name for p in (tmp_path / "book").iterdir()] == ["01-intro.md"]
@@ -1,23 +1,39 @@
+import functools
+import os
 import pathlib
 import tomllib
 
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _pyproject() -> dict:
+    """Parse pyproject.toml once for all scaffold assertions."""
+    return tomllib.loads((_ROOT / "pyproject.toml").read_text(encoding="utf-8"))
+
 
 def test_pyproject_has_cli_entry() -> None:
-    root = pathlib.Path(__file__).resolve().parents[1]
-    pyproject = root / "pyproject.toml"
-    data = tomllib.loads(pyproject.read_text(encoding="utf-8"))
-    scripts = data.get("project", {}).get("scripts", {})
+    scripts = _pyproject().get("project", {}).get("scripts", {})
     assert "pdf2md" in scripts
     assert scripts["pdf2md"] == "pdf2md.cli:app"
 
 
 def test_repository_scaffold_files_present() -> None:
-    root = pathlib.Path(__file__).resolve().parents[1]
-    expected = [
-        root / "src" / "pdf2md" / "cli.py",
-        root / "src" / "pdf2md" / "__init__.py",
-        root / "doc" / "prd.md",
-        root / "doc" / "design.md",
-    ]
-    for p in expected:
-        assert p.exists(), f"Missing scaffold file: {p}"
+    expected = {
+        "src/pdf2md/cli.py",
+        "src/pdf2md/__init__.py",
+        "doc/prd.md",
+        "doc/design.md",
+    }
+
+    # One pruned directory walk instead of a stat() per expected path
+    ignored = {".git", "__pycache__", ".venv", ".mypy_cache", ".pytest_cache"}
+    found = set()
+    for dirpath, dirnames, filenames in os.walk(_ROOT):
+        dirnames[:] = [d for d in dirnames if d not in ignored]
+        rel = pathlib.Path(dirpath).relative_to(_ROOT)
+        for filename in filenames:
+            found.add((rel / filename).as_posix())
+
+    missing = expected - found
+    assert not missing, f"Missing scaffold files: {sorted(missing)}"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pdf2md.utils import deterministic_slug, generate_unique_slug
+from pdf2md.utils import deterministic_slug, deterministic_slugs, generate_unique_slug
 
 
 class TestDeterministicSlugFormat:
@@ -214,3 +214,20 @@ class TestCollisionSuffixing:
         generate_unique_slug("Test", prefix_index=1, width=2, used_slugs=used_slugs)
         assert len(used_slugs) == 2
         assert "01-test-2" in used_slugs
+
+
+class TestDeterministicSlugsBatch:
+    """Tests for the batch slug API."""
+
+    def test_batch_matches_scalar_calls(self):
+        titles = ["Intro", "Data Analysis", "Results"]
+        assert deterministic_slugs(titles) == [
+            deterministic_slug(title, index, 2) for index, title in enumerate(titles, 1)
+        ]
+
+    def test_batch_start_index_and_width(self):
+        result = deterministic_slugs(["Alpha", "Beta"], start_index=9, width=3)
+        assert result == ["009-alpha", "010-beta"]
+
+    def test_batch_empty(self):
+        assert deterministic_slugs([]) == []